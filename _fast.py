@@ -0,0 +1,132 @@
+"""
+Compiled numeric kernels for the chart calculators.
+
+Numba is optional: when it is not installed every kernel falls back to an
+equivalent NumPy implementation with the same signature and results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def norm(deg):
+    """normalize_degrees for compiled callers: map to [0, 360)."""
+    return deg % 360.0
+
+
+@njit(cache=True, fastmath=True)
+def sig_dist(from_pos, to_pos):
+    """Signed angular distance from `from_pos` to `to_pos`, in (-180, 180]."""
+    diff = norm(to_pos) - norm(from_pos)
+    if diff > 180.0:
+        diff -= 360.0
+    elif diff <= -180.0:
+        diff += 360.0
+    return diff
+
+
+@njit(cache=True, fastmath=True)
+def is_applying(from_pos, to_pos, rate, aspect_angle):
+    """
+    True while the separation from `from_pos` to `to_pos`, whose signed distance
+    changes at `rate` degrees/day, is moving toward `aspect_angle`.
+    """
+    d = sig_dist(from_pos, to_pos)
+    return (abs(d) - aspect_angle) * d * rate < 0.0
+
+
+@njit(cache=True, fastmath=True)
+def house_of(longitude, cusps):
+    """Return the house (1-12) containing `longitude` for a float64[12] cusp array."""
+    p = longitude % 360.0
+    for i in range(12):
+        start = cusps[i] % 360.0
+        end = cusps[(i + 1) % 12] % 360.0
+        if start < end:
+            if start <= p < end:
+                return i + 1
+        else:  # House spans 0°
+            if p >= start or p < end:
+                return i + 1
+    return 1
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def find_aspects(pos1, pos2, angles, max_orb):
+        """
+        Find aspects between two sets of longitudes in [0, 360).
+
+        max_orb is a (len(pos1), len(pos2), len(angles)) array of allowed orbs; a
+        negative entry disables that combination. Returns (i, j, aspect, orb)
+        arrays for every hit, in (i, j, aspect) scan order.
+        """
+        n_1, n_2, n_a = pos1.size, pos2.size, angles.size
+        size = n_1 * n_2 * n_a
+        out_i = np.empty(size, np.int64)
+        out_j = np.empty(size, np.int64)
+        out_a = np.empty(size, np.int64)
+        out_orb = np.empty(size, np.float64)
+        if size == 0:
+            return out_i, out_j, out_a, out_orb
+        # A pair farther than the widest allowed orb from its nearest aspect angle
+        # cannot match any aspect, so it skips the aspect loop
+        sorted_angles = np.sort(angles)
+        limit = max_orb.max()
+        count = 0
+        for i in range(n_1):
+            for j in range(n_2):
+                diff = abs(pos1[i] - pos2[j])
+                sep = min(diff, 360.0 - diff)
+                k = np.searchsorted(sorted_angles, sep)
+                nearest = 360.0
+                if k < n_a:
+                    nearest = sorted_angles[k] - sep
+                if k > 0:
+                    nearest = min(nearest, sep - sorted_angles[k - 1])
+                if nearest > limit:
+                    continue
+                for a in range(n_a):
+                    orb = abs(sep - angles[a])
+                    if orb <= max_orb[i, j, a]:
+                        out_i[count] = i
+                        out_j[count] = j
+                        out_a[count] = a
+                        out_orb[count] = orb
+                        count += 1
+        return out_i[:count], out_j[:count], out_a[:count], out_orb[:count]
+else:
+    def find_aspects(pos1, pos2, angles, max_orb):
+        """
+        Find aspects between two sets of longitudes in [0, 360).
+
+        max_orb is a (len(pos1), len(pos2), len(angles)) array of allowed orbs; a
+        negative entry disables that combination. Returns (i, j, aspect, orb)
+        arrays for every hit, in (i, j, aspect) scan order.
+        """
+        if max_orb.size == 0:
+            empty = np.empty(0, np.int64)
+            return empty, empty, empty, np.empty(0)
+        diff = np.abs(pos1[:, None] - pos2[None, :])
+        sep = np.minimum(diff, 360.0 - diff)
+        # Only pairs within the widest allowed orb of their nearest aspect angle can match
+        sorted_angles = np.sort(angles)
+        k = np.searchsorted(sorted_angles, sep)
+        upper = np.where(k < angles.size, sorted_angles[np.minimum(k, angles.size - 1)] - sep, np.inf)
+        lower = np.where(k > 0, sep - sorted_angles[np.maximum(k - 1, 0)], np.inf)
+        i, j = np.nonzero(np.minimum(upper, lower) <= max_orb.max())
+        orb = np.abs(sep[i, j, None] - angles[None, :])
+        p, a = np.nonzero(orb <= max_orb[i, j])
+        return i[p], j[p], a, orb[p, a]
@@ -1,3 +1,7 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+import anyio.to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
@@ -10,14 +14,36 @@ from exceptions import (
     InvalidCoordinatesError,
     InvalidTimezoneError
 )
-from routers import router
+from routers import prewarm, router, run_natal_coalescer, shutdown_process_pool, start_process_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Size the threadpool that runs the synchronous chart endpoints, prewarm the
+    calculators, own the worker process pool and run the natal chart request
+    coalescer for the life of the app.
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+    await anyio.to_thread.run_sync(prewarm)
+    await start_process_pool()
+    coalescer = asyncio.create_task(run_natal_coalescer())
+    try:
+        yield
+    finally:
+        coalescer.cancel()
+        with suppress(asyncio.CancelledError):
+            await coalescer
+        shutdown_process_pool()
+
 
 app = FastAPI(
     title="Swiss Ephemeris API",
     description="Astrological chart calculation API using Swiss Ephemeris",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS Middleware
@@ -433,6 +433,9 @@ class TransitAspectData(BaseModel):
     transit_retrograde: bool
     transit_house: int
 
+    # natal.TransitChart emits AspectHit dataclasses rather than dicts
+    model_config = ConfigDict(from_attributes=True)
+
 
 class TransitResponse(BaseModel):
     """Transit calculation response."""
@@ -12,13 +12,20 @@ Fixes in v4:
 """
 
 import swisseph as swe
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, Union
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta, tzinfo
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 from dataclasses import dataclass, field
 from enum import Enum
+import functools
+import heapq
 import math
+import numpy as np
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import pytz
 
+from _fast import find_aspects, house_of, is_applying
+
 
 class NodeType(Enum):
     TRUE = "true"
@@ -46,7 +53,7 @@ class AspectDefinition:
     major: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TransitEvent:
     """Represents a transit aspect event."""
     transit_planet: str
@@ -63,6 +70,22 @@ class TransitEvent:
         return f"{self.exact_date.strftime('%Y-%m-%d %H:%M')} T.{self.transit_planet}{r} {self.aspect_symbol} N.{self.natal_planet}"
 
 
+@dataclass(slots=True)
+class AspectHit:
+    """Represents a transit aspect to a natal point."""
+    transit_planet: str
+    natal_planet: str
+    aspect: str
+    symbol: str
+    angle: float
+    orb: float
+    max_orb: float
+    applying: bool
+    major: bool
+    transit_retrograde: bool
+    transit_house: int
+
+
 class ChartConfig:
     """Shared configuration for chart calculations."""
     
@@ -138,10 +161,158 @@ class ChartConfig:
         AspectDefinition(135, 'Sesquiquadrate', '⚼', (2, 2, 2, 1), (1, 1, 1, 1), False),
         AspectDefinition(150, 'Quincunx', '⚻', (3, 3, 2, 2), (2, 2, 1, 1), False),
     ]
+    
+    # ASPECTS split once so callers pick a list instead of testing `major` per aspect
+    ASPECTS_MAJOR = tuple(a for a in ASPECTS if a.major)
+    ASPECTS_MINOR = tuple(a for a in ASPECTS if not a.major)
+    ASPECTS_ALL = tuple(ASPECTS)
+
+
+# Static per-sign fields of _get_sign_info, indexed by sign number
+_SIGN_META = [
+    {
+        'sign': sign['name'],
+        'sign_symbol': sign['symbol'],
+        'sign_num': i,
+        'element': sign['element'],
+        'modality': sign['modality'],
+        'ruler': sign['ruler'],
+    }
+    for i, sign in enumerate(ChartConfig.SIGNS)
+]
+
+
+# _DIGNITY_TABLE[(planet, sign_num)] = essential dignity, for the planets and signs that have one
+_DIGNITY_TABLE: Dict[Tuple[str, int], str] = {}
+for _planet, _rules in ChartConfig.DIGNITIES.items():
+    for _sign_num, _sign in enumerate(ChartConfig.SIGNS):
+        _name = _sign['name']
+        if _name in _rules['domicile']:
+            _DIGNITY_TABLE[(_planet, _sign_num)] = 'domicile'
+        elif _name == _rules['exaltation']:
+            _DIGNITY_TABLE[(_planet, _sign_num)] = 'exaltation'
+        elif _name in _rules['detriment']:
+            _DIGNITY_TABLE[(_planet, _sign_num)] = 'detriment'
+        elif _name == _rules['fall']:
+            _DIGNITY_TABLE[(_planet, _sign_num)] = 'fall'
+del _planet, _rules, _sign_num, _sign, _name
+
+_SIGN_INDEX = {sign['name']: i for i, sign in enumerate(ChartConfig.SIGNS)}
+
+
+def _split_longitude(longitude: float) -> Tuple[int, float, int, int]:
+    """Decompose a longitude into (sign_num, degree in sign, whole degrees, minutes)."""
+    sign_num, degree_in_sign = divmod(normalize_degrees(longitude), 30)
+    # Whole arcseconds absorb float noise such as 14.999999999999998; clamp to stay in the sign
+    arcsec = min(int(round(degree_in_sign * 3600)), 30 * 3600 - 1)
+    deg_int, arcsec = divmod(arcsec, 3600)
+    return int(sign_num), degree_in_sign, deg_int, arcsec // 60
+
+
+@functools.lru_cache(maxsize=65536)
+def _format_position(sign_num: int, deg_int: int, minutes: int) -> Tuple[str, str]:
+    """Long and short display strings for a position; only 12*30*60 distinct inputs exist."""
+    sign = ChartConfig.SIGNS[sign_num]
+    return (f"{deg_int}°{minutes:02d}' {sign['name']}",
+            f"{deg_int}°{minutes:02d}' {sign['symbol']}")
+
+
+@functools.lru_cache(maxsize=65536)
+def _calc_ut_cached(jd: float, body_id: int, flags: int, sid_mode: int) -> Tuple[float, ...]:
+    """
+    Memoized swe.calc_ut position tuple.
+
+    sid_mode is the sidereal mode (-1 when tropical). It alters FLG_SIDEREAL
+    results without showing up in the flags, and the Swiss Ephemeris mode is
+    global state, so it is applied here as well as keying the cache.
+    """
+    if sid_mode >= 0:
+        swe.set_sid_mode(sid_mode)
+    return swe.calc_ut(jd, body_id, flags)[0]
+
+
+# Core planet ids in ChartConfig.PLANETS_CORE order, for _calc_ut_batch
+_CORE_IDS = tuple(ChartConfig.PLANETS_CORE.values())
+
+
+@functools.lru_cache(maxsize=4096)
+def _calc_ut_batch(jd: float, body_ids: Tuple[int, ...], flags: int, sid_mode: int) -> np.ndarray:
+    """
+    Memoized swe.calc_ut positions of several bodies at one Julian day, as a
+    read-only (len(body_ids), 6) array. sid_mode is handled as in _calc_ut_cached.
+    """
+    if sid_mode >= 0:
+        swe.set_sid_mode(sid_mode)
+    out = np.array([swe.calc_ut(jd, body_id, flags)[0] for body_id in body_ids], dtype=float)
+    out.flags.writeable = False
+    return out
+
+
+# Orb category per point name: 0=luminary/angle, 1=personal, 2=social, anything else 3=outer
+_CATEGORY: Dict[str, int] = {}
+for _name in ChartConfig.LUMINARIES | {'ASC', 'MC', 'DSC', 'IC', 'Ascendant', 'Vertex'}:
+    _CATEGORY[_name] = 0
+for _name in ChartConfig.PERSONAL_PLANETS:
+    _CATEGORY[_name] = 1
+for _name in ChartConfig.SOCIAL_PLANETS:
+    _CATEGORY[_name] = 2
+for _name in list(_CATEGORY):
+    _CATEGORY['Natal ' + _name] = _CATEGORY[_name]
+del _name
+
+
+# Aspect lookup tables, indexed like ChartConfig.ASPECTS
+_ASPECT_ANGLES = np.array([a.angle for a in ChartConfig.ASPECTS], dtype=float)
+# _NATAL_CAT_ORB[aspect, cat1, cat2] = min(natal orb of cat1, natal orb of cat2)
+_NATAL_CAT_ORB = np.array([np.minimum.outer(a.natal_orbs, a.natal_orbs) for a in ChartConfig.ASPECTS],
+                          dtype=float)
+# _TRANSIT_CAT_ORB[aspect, cat1, cat2] = min(transit orb of cat1, transit orb of cat2)
+_TRANSIT_CAT_ORB = np.array([np.minimum.outer(a.transit_orbs, a.transit_orbs) for a in ChartConfig.ASPECTS],
+                            dtype=float)
+
+# Per include_minor setting: (aspect definitions, angles, natal orb table, transit orb table),
+# restricted to the aspects that setting searches for
+_ACTIVE_ASPECTS = {}
+for _include_minor, _defs in ((False, ChartConfig.ASPECTS_MAJOR), (True, ChartConfig.ASPECTS_ALL)):
+    _idx = np.array([ChartConfig.ASPECTS.index(a) for a in _defs])
+    _ACTIVE_ASPECTS[_include_minor] = (_defs, _ASPECT_ANGLES[_idx], _NATAL_CAT_ORB[_idx], _TRANSIT_CAT_ORB[_idx])
+del _include_minor, _defs, _idx
+
+# Initial capacity of the per-chart body arrays: the configured planets, both nodes,
+# Lilith and the Part of Fortune. _store_planet grows the arrays if more are added.
+_INITIAL_BODIES = len(ChartConfig.PLANETS_CORE) + len(ChartConfig.PLANETS_EXTENDED) + 4
+
+# Julian day of 1970-01-01T00:00 UTC
+_UNIX_EPOCH_JD = 2440587.5
+
+# find_exact_transits sampling step per transiting planet, in days. Each is well under
+# the time the planet needs to move between two target points of the same natal point.
+_SEARCH_STEP_DAYS = {'Moon': 0.25, 'Sun': 1.0, 'Mercury': 1.0, 'Venus': 1.0, 'Mars': 2.0, 'Jupiter': 5.0}
+_SEARCH_STEP_DEFAULT = 15.0
+# Root and station time tolerance of find_exact_transits (one second), in days
+_ROOT_TOL_DAYS = 1 / 86400
+_MAX_ROOT_ITER = 60
+# find_exact_transits de-duplication window per transiting planet, in seconds
+_DEDUP_WINDOW_SECONDS = {'Moon': 6 * 3600, 'Sun': 24 * 3600, 'Mercury': 24 * 3600,
+                         'Venus': 24 * 3600, 'Mars': 24 * 3600}
+_DEDUP_WINDOW_DEFAULT = 72 * 3600
+
+# format_transit_text aspect rows
+_T2N_ROW = "  T.{0.transit_planet:<10}{1} {0.symbol} N.{0.natal_planet:<14} orb {0.orb:5.2f}° ({2})"
+_T2T_ROW = "  {planet1:<12} {symbol} {planet2:<12} orb {orb:5.2f}° ({status})"
+_MOTION_STATUS = {True: "applying", False: "separating"}
+_RETRO_MARK = {True: " (R)", False: ""}
 
 
 def normalize_degrees(deg: float) -> float:
     """Normalize degrees to 0-360 range."""
+    # Inputs are nearly always within one turn of the range; skip fmod for those
+    if 0.0 <= deg < 360.0:
+        return deg
+    if -360.0 <= deg < 0.0:
+        return deg + 360.0
+    if 360.0 <= deg < 720.0:
+        return deg - 360.0
     return deg % 360
 
 
@@ -154,6 +325,38 @@ def angular_distance(pos1: float, pos2: float) -> float:
     return min(diff, 360 - diff)
 
 
+def _signed_distance_raw(from_pos, to_pos):
+    """
+    signed_angular_distance for positions already in [0, 360), skipping the
+    normalization. Works elementwise on NumPy arrays.
+    """
+    diff = to_pos - from_pos
+    return np.where(diff > 180, diff - 360, np.where(diff <= -180, diff + 360, diff))
+
+
+def _local_naive_times(utc_us: np.ndarray, tz: tzinfo) -> List[datetime]:
+    """
+    Convert datetime64[us] UTC instants to naive wall-clock datetimes in `tz`.
+    
+    The UTC offset is looked up once per day of the covered range and added to
+    every instant of a day whose offset does not change; instants in a day that
+    contains a DST transition are converted individually.
+    """
+    if utc_us.size == 0:
+        return []
+    day = np.timedelta64(1, 'D')
+    first = utc_us.min()
+    day_idx = (utc_us - first) // day
+    grid = (first + np.arange(day_idx.max() + 2) * day).tolist()
+    offsets = np.array([t.replace(tzinfo=UTC).astimezone(tz).utcoffset() // timedelta(microseconds=1)
+                        for t in grid], dtype=np.int64)
+    
+    local = (utc_us + offsets[day_idx].astype('m8[us]')).tolist()
+    for n in np.nonzero(offsets[day_idx] != offsets[day_idx + 1])[0].tolist():
+        local[n] = utc_us[n].item().replace(tzinfo=UTC).astimezone(tz).replace(tzinfo=None)
+    return local
+
+
 def signed_angular_distance(from_pos: float, to_pos: float) -> float:
     """
     Calculate signed angular distance from one position to another.
@@ -176,7 +379,7 @@ class NatalChart:
                  latitude: float,
                  longitude: float,
                  house_system: str = 'Placidus',
-                 timezone: Optional[Union[str, pytz.tzinfo.BaseTzInfo]] = None,
+                 timezone: Optional[Union[str, tzinfo]] = None,
                  ephemeris_path: Optional[str] = None,
                  node_type: NodeType = NodeType.TRUE,
                  zodiac_type: ZodiacType = ZodiacType.TROPICAL,
@@ -202,16 +405,33 @@ class NatalChart:
         self.include_minor_aspects = include_minor_aspects
         self.pof_formula = pof_formula
         self._use_moshier = True
+        self.ephemeris_path = ephemeris_path
+        
+        # Per-chart constants derived from the enum settings
+        self._sidereal_flag = swe.FLG_SIDEREAL if zodiac_type == ZodiacType.SIDEREAL else 0
+        self._sid_key = sidereal_mode if self._sidereal_flag else -1
+        self._node_id = swe.TRUE_NODE if node_type == NodeType.TRUE else swe.MEAN_NODE
+        self._use_day_pof = pof_formula == PartOfFortuneFormula.MODERN
         
         self._init_ephemeris(ephemeris_path)
+        self._flags = self._get_calc_flags()
         
         self.timezone = self._parse_timezone(timezone)
         self.birth_date_utc = self._convert_to_utc(birth_date, self.timezone)
         self.julian_day = self._calculate_julian_day(self.birth_date_utc)
         
         self.planets: Dict = {}
+        # Struct-of-arrays mirror of self.planets: slot i holds body _planet_names[i]
+        self._planet_names: List[str] = []
+        self._planet_slot: Dict[str, int] = {}
+        self._planet_lons = np.empty(_INITIAL_BODIES, dtype=np.float64)
+        self._planet_speeds = np.empty(_INITIAL_BODIES, dtype=np.float64)
         self.houses: Dict = {}
         self.aspects: List = []
+        self._aspects_orb_factor: Optional[float] = None
+        self._cusps_np: np.ndarray = np.empty(0)
+        # (sorted cusps, house index per sorted cusp) for _houses_of; None when unusable
+        self._cusp_order: Optional[Tuple[np.ndarray, np.ndarray]] = None
         self._is_day_chart: Optional[bool] = None
     
     def _init_ephemeris(self, ephemeris_path: Optional[str]) -> None:
@@ -227,13 +447,18 @@ class NatalChart:
             except:
                 pass
         
-        if self.zodiac_type == ZodiacType.SIDEREAL:
+        if self._sidereal_flag:
             swe.set_sid_mode(self.sidereal_mode)
     
     def _parse_timezone(self, timezone):
         if timezone is None:
             return None
         if isinstance(timezone, str):
+            try:
+                return ZoneInfo(timezone)
+            except (ZoneInfoNotFoundError, ValueError):
+                pass
+            # Fall back to pytz's bundled database on hosts without system tzdata
             try:
                 return pytz.timezone(timezone)
             except pytz.exceptions.UnknownTimeZoneError:
@@ -242,80 +467,94 @@ class NatalChart:
     
     def _convert_to_utc(self, dt: datetime, tz) -> datetime:
         if dt.tzinfo is not None:
-            return dt.astimezone(pytz.UTC)
-        if tz is not None:
+            return dt.astimezone(UTC)
+        if tz is None:
+            return dt.replace(tzinfo=UTC)
+        if hasattr(tz, 'localize'):  # pytz zone
             try:
                 local_dt = tz.localize(dt, is_dst=None)
             except pytz.exceptions.AmbiguousTimeError:
                 local_dt = tz.localize(dt, is_dst=False)
             except pytz.exceptions.NonExistentTimeError:
                 local_dt = tz.localize(dt, is_dst=True)
-            return local_dt.astimezone(pytz.UTC)
-        return dt.replace(tzinfo=pytz.UTC)
+            return local_dt.astimezone(UTC)
+        # fold=1 takes the later reading of a repeated wall time and the post-transition
+        # offset for a skipped one, as is_dst=False / is_dst=True do in the pytz branch
+        return dt.replace(tzinfo=tz, fold=1).astimezone(UTC)
     
     def _calculate_julian_day(self, dt: datetime) -> float:
         hour_decimal = dt.hour + dt.minute / 60.0 + dt.second / 3600.0 + dt.microsecond / 3600000000.0
         return swe.julday(dt.year, dt.month, dt.day, hour_decimal)
     
     def _get_calc_flags(self) -> int:
+        """Build the swe flag word; computed once in __init__ and cached as self._flags."""
         flags = swe.FLG_MOSEPH if self._use_moshier else swe.FLG_SWIEPH
-        flags |= swe.FLG_SPEED
-        if self.zodiac_type == ZodiacType.SIDEREAL:
-            flags |= swe.FLG_SIDEREAL
-        return flags
+        return flags | swe.FLG_SPEED | self._sidereal_flag
     
     def _get_sign_info(self, longitude: float) -> Dict:
-        longitude = normalize_degrees(longitude)
-        sign_num = int(longitude / 30)
-        degree_in_sign = longitude % 30
-        sign_data = ChartConfig.SIGNS[sign_num]
-        deg_int = int(degree_in_sign)
-        minutes = int((degree_in_sign - deg_int) * 60)
+        sign_num, degree_in_sign, deg_int, minutes = _split_longitude(longitude)
+        formatted, formatted_short = _format_position(sign_num, deg_int, minutes)
         
         return {
-            'sign': sign_data['name'],
-            'sign_symbol': sign_data['symbol'],
-            'sign_num': sign_num,
+            **_SIGN_META[sign_num],
             'degree': degree_in_sign,
             'degree_int': deg_int,
             'minutes': minutes,
-            'element': sign_data['element'],
-            'modality': sign_data['modality'],
-            'ruler': sign_data['ruler'],
-            'formatted': f"{deg_int}°{minutes:02d}' {sign_data['name']}",
-            'formatted_short': f"{deg_int}°{minutes:02d}' {sign_data['symbol']}"
+            'formatted': formatted,
+            'formatted_short': formatted_short,
         }
     
     def _get_dignity(self, planet_name: str, sign: str) -> Optional[str]:
-        if planet_name not in ChartConfig.DIGNITIES:
-            return None
-        dignity = ChartConfig.DIGNITIES[planet_name]
-        if sign in dignity['domicile']:
-            return 'domicile'
-        elif sign == dignity['exaltation']:
-            return 'exaltation'
-        elif sign in dignity['detriment']:
-            return 'detriment'
-        elif sign == dignity['fall']:
-            return 'fall'
-        return None
+        return _DIGNITY_TABLE.get((planet_name, _SIGN_INDEX.get(sign)))
+    
+    def _build_planet_entry(self, name: str, longitude: float, latitude: float,
+                            distance: float, speed: float) -> Dict:
+        """Position, sign and dignity fields of one body, built as a single dict."""
+        sign_num, degree_in_sign, deg_int, minutes = _split_longitude(longitude)
+        formatted, formatted_short = _format_position(sign_num, deg_int, minutes)
+        return {
+            'longitude': longitude,
+            'latitude': latitude,
+            'distance': distance,
+            'speed': speed,
+            'retrograde': speed < 0,
+            **_SIGN_META[sign_num],
+            'degree': degree_in_sign,
+            'degree_int': deg_int,
+            'minutes': minutes,
+            'formatted': formatted,
+            'formatted_short': formatted_short,
+            'dignity': _DIGNITY_TABLE.get((name, sign_num)),
+        }
     
     def _get_planet_category(self, planet_name: str) -> int:
         """0=luminary/angle, 1=personal, 2=social, 3=outer"""
-        clean_name = planet_name.replace('Natal ', '')
-        if clean_name in ChartConfig.LUMINARIES or clean_name in ['ASC', 'MC', 'DSC', 'IC', 'Ascendant', 'Vertex']:
-            return 0
-        elif clean_name in ChartConfig.PERSONAL_PLANETS:
-            return 1
-        elif clean_name in ChartConfig.SOCIAL_PLANETS:
-            return 2
-        return 3
+        return _CATEGORY.get(planet_name, 3)
+    
+    def _store_planet(self, name: str, entry: Dict) -> None:
+        """Record a body in self.planets and its longitude/speed slot."""
+        self.planets[name] = entry
+        slot = self._planet_slot.get(name)
+        if slot is None:
+            slot = self._planet_slot[name] = len(self._planet_names)
+            self._planet_names.append(name)
+            if slot == self._planet_lons.size:
+                self._planet_lons = np.resize(self._planet_lons, 2 * slot)
+                self._planet_speeds = np.resize(self._planet_speeds, 2 * slot)
+        self._planet_lons[slot] = entry['longitude']
+        self._planet_speeds[slot] = entry['speed']
     
     def calculate_planets(self) -> Dict:
-        flags = self._get_calc_flags()
+        # Chart inputs are fixed at construction, so computed results never go stale
+        if self.planets:
+            return self.planets
         
-        for name, planet_id in ChartConfig.PLANETS_CORE.items():
-            self._calculate_body(name, planet_id, flags)
+        flags = self._flags
+        
+        # Core planets and the node in one batch; the last row is the node
+        rows = _calc_ut_batch(self.julian_day, _CORE_IDS + (self._node_id,), flags, self._sid_key).tolist()
+        for name, row in zip(ChartConfig.PLANETS_CORE, rows):
+            self._store_planet(name, self._build_planet_entry(name, row[0], row[1], row[2], row[3]))
         
         for name, planet_id in ChartConfig.PLANETS_EXTENDED.items():
             try:
@@ -323,21 +562,13 @@ class NatalChart:
             except:
                 pass
         
-        node_id = swe.TRUE_NODE if self.node_type == NodeType.TRUE else swe.MEAN_NODE
-        self._calculate_body('North Node', node_id, flags)
+        node = rows[-1]
+        self._store_planet('North Node', self._build_planet_entry('North Node', node[0], node[1], node[2], node[3]))
         
         nn = self.planets['North Node']
         sn_long = normalize_degrees(nn['longitude'] + 180)
-        sign_info = self._get_sign_info(sn_long)
-        self.planets['South Node'] = {
-            'longitude': sn_long,
-            'latitude': 0,
-            'distance': nn['distance'],
-            'speed': nn['speed'],
-            'retrograde': nn['retrograde'],
-            **sign_info,
-            'dignity': None,
-        }
+        self._store_planet('South Node',
+                           self._build_planet_entry('South Node', sn_long, 0, nn['distance'], nn['speed']))
         
         try:
             self._calculate_body('Lilith', swe.MEAN_APOG, flags)
@@ -347,19 +578,13 @@ class NatalChart:
         return self.planets
     
     def _calculate_body(self, name: str, body_id: int, flags: int) -> None:
-        result, _ = swe.calc_ut(self.julian_day, body_id, flags)
-        sign_info = self._get_sign_info(result[0])
-        self.planets[name] = {
-            'longitude': result[0],
-            'latitude': result[1],
-            'distance': result[2],
-            'speed': result[3],
-            'retrograde': result[3] < 0,
-            **sign_info,
-            'dignity': self._get_dignity(name, sign_info['sign']),
-        }
+        result = _calc_ut_cached(self.julian_day, body_id, flags, self._sid_key)
+        self._store_planet(name, self._build_planet_entry(name, result[0], result[1], result[2], result[3]))
     
     def calculate_houses(self) -> Dict:
+        if self.houses:
+            return self.houses
+        
         cusps_raw, ascmc = swe.houses_ex(
             self.julian_day, self.latitude, self.longitude, self.house_system_code
         )
@@ -375,6 +600,16 @@ class NatalChart:
             'ic': normalize_degrees(ascmc[1] + 180),
             'descendant': normalize_degrees(ascmc[0] + 180),
         }
+        self._cusps_np = np.asarray(cusps, dtype=np.float64)
+        
+        # Binary search over sorted cusps is equivalent to the cusp scan only when
+        # the cusps are distinct and already run in circular order
+        cusps_mod = self._cusps_np % 360
+        order = np.argsort(cusps_mod)
+        if np.all(np.diff(order) % 12 == 1) and np.all(np.diff(cusps_mod[order]) > 0):
+            self._cusp_order = (cusps_mod[order], order)
+        else:
+            self._cusp_order = None
         
         for angle in ['ascendant', 'mc', 'ic', 'descendant', 'vertex']:
             sign_info = self._get_sign_info(self.houses[angle])
@@ -396,11 +631,13 @@ class NatalChart:
     def _is_day_chart_calc(self) -> bool:
         if self._is_day_chart is not None:
             return self._is_day_chart
-        sun_house = self.get_planet_in_house('Sun')
+        sun_house = self.planets['Sun'].get('house') or self.get_planet_in_house('Sun')
         self._is_day_chart = sun_house >= 7
         return self._is_day_chart
     
     def calculate_part_of_fortune(self) -> Dict:
+        if 'Part of Fortune' in self.planets:
+            return self.planets['Part of Fortune']
         if not self.planets:
             self.calculate_planets()
         if not self.houses:
@@ -410,119 +647,108 @@ class NatalChart:
         sun = self.planets['Sun']['longitude']
         moon = self.planets['Moon']['longitude']
         
-        use_day = self.pof_formula == PartOfFortuneFormula.MODERN or self._is_day_chart_calc()
+        use_day = self._use_day_pof or self._is_day_chart_calc()
         
         if use_day:
             pof = normalize_degrees(asc + moon - sun)
         else:
             pof = normalize_degrees(asc + sun - moon)
         
-        sign_info = self._get_sign_info(pof)
-        self.planets['Part of Fortune'] = {
-            'longitude': pof,
-            'latitude': 0,
-            'distance': 0,
-            'speed': 0,
-            'retrograde': False,
-            **sign_info,
-            'dignity': None,
-        }
+        self._store_planet('Part of Fortune', self._build_planet_entry('Part of Fortune', pof, 0, 0, 0))
         return self.planets['Part of Fortune']
     
     def get_planet_in_house(self, planet_name: str) -> int:
         if planet_name not in self.planets:
             raise ValueError(f"Planet '{planet_name}' not found")
         
-        planet_long = normalize_degrees(self.planets[planet_name]['longitude'])
-        cusps = self.houses['cusps']
-        
-        for i in range(12):
-            cusp_start = normalize_degrees(cusps[i])
-            cusp_end = normalize_degrees(cusps[(i + 1) % 12])
-            
-            if cusp_start < cusp_end:
-                if cusp_start <= planet_long < cusp_end:
-                    return i + 1
-            else:  # House spans 0°
-                if planet_long >= cusp_start or planet_long < cusp_end:
-                    return i + 1
-        return 1
+        return house_of(self.planets[planet_name]['longitude'], self._cusps_np)
+    
+    def _houses_of(self, longitudes: np.ndarray) -> List[int]:
+        """House number (1-12) for each longitude, as get_planet_in_house would assign it."""
+        if self._cusp_order is None:
+            return [house_of(lon, self._cusps_np) for lon in longitudes]
+        sorted_cusps, order = self._cusp_order
+        idx = np.searchsorted(sorted_cusps, longitudes % 360, side='right') - 1
+        return (order[idx] + 1).tolist()
     
     def _calculate_natal_applying(self, pos1: float, pos2: float,
                                    speed1: float, speed2: float,
                                    aspect_angle: float) -> bool:
-        """Determine if natal aspect is applying or separating."""
+        """
+        Determine if natal aspect is applying or separating.
+        
+        The separation changes at sign(d) * (speed1 - speed2), where d is the signed
+        distance from pos2 to pos1; the aspect applies while that rate has the
+        opposite sign to (separation - aspect_angle).
+        """
         if speed1 == 0 and speed2 == 0:
             return False
         
-        # Current angular separation
-        sep = angular_distance(pos1, pos2)
-        
-        # Calculate where they'll be in a small time step
-        future_pos1 = normalize_degrees(pos1 + speed1 * 0.1)  # 0.1 day
-        future_pos2 = normalize_degrees(pos2 + speed2 * 0.1)
-        future_sep = angular_distance(future_pos1, future_pos2)
-        
-        # Applying if separation is getting closer to the exact aspect angle
-        current_orb = abs(sep - aspect_angle)
-        future_orb = abs(future_sep - aspect_angle)
-        
-        return future_orb < current_orb
+        return is_applying(pos2, pos1, speed1 - speed2, aspect_angle)
     
     def calculate_aspects(self, orb_factor: float = 1.0) -> List[Dict]:
+        if self._aspects_orb_factor == orb_factor:
+            return self.aspects
         if not self.planets:
             self.calculate_planets()
         
         self.aspects = []
-        points = {name: {'longitude': data['longitude'], 'speed': data.get('speed', 0)}
-                  for name, data in self.planets.items()}
-        
-        # Add angles
-        points['Ascendant'] = {'longitude': self.houses['ascendant'], 'speed': 0}
-        points['MC'] = {'longitude': self.houses['mc'], 'speed': 0}
-        
-        point_names = list(points.keys())
-        
-        for i, name1 in enumerate(point_names):
-            for name2 in point_names[i + 1:]:
-                pos1, pos2 = points[name1]['longitude'], points[name2]['longitude']
-                speed1, speed2 = points[name1]['speed'], points[name2]['speed']
-                
-                sep = angular_distance(pos1, pos2)
-                
-                for aspect_def in ChartConfig.ASPECTS:
-                    if not aspect_def.major and not self.include_minor_aspects:
-                        continue
-                    
-                    orb = abs(sep - aspect_def.angle)
-                    cat1 = self._get_planet_category(name1)
-                    cat2 = self._get_planet_category(name2)
-                    max_orb = min(aspect_def.natal_orbs[cat1], aspect_def.natal_orbs[cat2]) * orb_factor
-                    
-                    if orb <= max_orb:
-                        self.aspects.append({
-                            'planet1': name1,
-                            'planet2': name2,
-                            'aspect': aspect_def.name,
-                            'symbol': aspect_def.symbol,
-                            'angle': aspect_def.angle,
-                            'orb': round(orb, 4),
-                            'max_orb': max_orb,
-                            'applying': self._calculate_natal_applying(pos1, pos2, speed1, speed2, aspect_def.angle),
-                            'major': aspect_def.major,
-                        })
-        
-        self.aspects.sort(key=lambda x: x['orb'])
+        n_bodies = len(self._planet_names)
+        
+        # Bodies plus the Ascendant and MC, which are treated as stationary
+        point_names = self._planet_names + ['Ascendant', 'MC']
+        n_points = len(point_names)
+        raw_lon = np.append(self._planet_lons[:n_bodies], (self.houses['ascendant'], self.houses['mc']))
+        speeds = np.append(self._planet_speeds[:n_bodies], (0.0, 0.0))
+        
+        cat = np.array([_CATEGORY.get(name, 3) for name in point_names], dtype=np.int8)
+        aspect_defs, angles, cat_orb, _ = _ACTIVE_ASPECTS[bool(self.include_minor_aspects)]
+        append = self.aspects.append
+        
+        # Allowed orb per (point1, point2, aspect), disabled below the diagonal so
+        # each pair is scanned once; ephemeris longitudes are already within [0, 360)
+        max_orb = cat_orb[:, cat[:, None], cat[None, :]].transpose(1, 2, 0) * orb_factor
+        max_orb[np.tril_indices(n_points)] = -1.0
+        
+        hit_i, hit_j, hit_a, hit_orb = find_aspects(raw_lon, raw_lon, angles, max_orb)
+        hit_orbs = [round(v, 4) for v in hit_orb.tolist()]
+        
+        # Applying test of _calculate_natal_applying, for all hits at once
+        d = _signed_distance_raw(raw_lon[hit_j], raw_lon[hit_i])
+        hit_applying = ((np.abs(d) - angles[hit_a]) * d * (speeds[hit_i] - speeds[hit_j]) < 0).tolist()
+        
+        # Emit hits already ordered by rounded orb; the stable sort keeps ties in scan order
+        for h in np.argsort(hit_orbs, kind='stable'):
+            i, j, a = hit_i[h], hit_j[h], hit_a[h]
+            name1, name2 = point_names[i], point_names[j]
+            aspect_def = aspect_defs[a]
+            append({
+                'planet1': name1,
+                'planet2': name2,
+                'aspect': aspect_def.name,
+                'symbol': aspect_def.symbol,
+                'angle': aspect_def.angle,
+                'orb': hit_orbs[h],
+                'max_orb': float(max_orb[i, j, a]),
+                'applying': hit_applying[h],
+                'major': aspect_def.major,
+            })
+        
+        self._aspects_orb_factor = orb_factor
         return self.aspects
     
     def generate_full_chart(self) -> Dict:
         self.calculate_planets()
         self.calculate_houses()
-        self.calculate_part_of_fortune()
-        self.calculate_aspects()
         
-        for planet_name in self.planets:
-            self.planets[planet_name]['house'] = self.get_planet_in_house(planet_name)
+        # Assign houses before the Part of Fortune so the day/night test reuses the Sun's
+        houses = self._houses_of(self._planet_lons[:len(self._planet_names)])
+        for planet_name, house in zip(self._planet_names, houses):
+            self.planets[planet_name]['house'] = house
+        
+        pof = self.calculate_part_of_fortune()
+        pof['house'] = self.get_planet_in_house('Part of Fortune')
+        self.calculate_aspects()
         
         return {
             'metadata': {
@@ -604,22 +830,136 @@ class TransitChart:
         self.transit_date_utc: Optional[datetime] = None
         self.transit_julian_day: Optional[float] = None
         self.transit_planets: Dict = {}
-        self.transit_to_natal_aspects: List = []
+        self.transit_to_natal_aspects: List[AspectHit] = []
         self.transit_to_transit_aspects: List = []
+        self._transit_names: Tuple[str, ...] = ()
+        self._bodies_t2n: List[str] = []
+        self._bodies_t2t: List[str] = []
+        self._idx_t2n: np.ndarray = np.empty(0, dtype=np.intp)
+        self._idx_t2t: np.ndarray = np.empty(0, dtype=np.intp)
+        self._cat_t2n: np.ndarray = np.empty(0, dtype=np.intp)
+        self._cat_t2t: np.ndarray = np.empty(0, dtype=np.intp)
+        self._transit_lons: np.ndarray = np.empty(0)
+        self._transit_speeds: np.ndarray = np.empty(0)
+        self._natal_names_arr: List[str] = []
+        self._natal_lon_arr: np.ndarray = np.empty(0)
+        self._natal_cat_arr: np.ndarray = np.empty(0, dtype=np.intp)
+        # Allowed-orb tables per (include_minor, orb_factor), valid for the current body lists
+        self._max_orb_t2n: Dict[Tuple[bool, float], np.ndarray] = {}
+        self._max_orb_t2t: Dict[Tuple[bool, float], np.ndarray] = {}
+        self._build_natal_points()
     
-    def _calculate_planet_position(self, jd: float, planet_id: int) -> Tuple[float, float]:
-        """Calculate planet position and speed for a Julian day."""
-        flags = self.natal._get_calc_flags()
-        result, _ = swe.calc_ut(jd, planet_id, flags)
-        return result[0], result[3]  # longitude, speed
+    def _calculate_planet_series(self, jd_vec: np.ndarray, planet_id: int,
+                                 memoize: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate longitude and speed series of one planet over an array of Julian days.
+        
+        memoize=False bypasses the ephemeris cache, for one-off times such as root
+        search iterates that would only evict reusable entries.
+        """
+        flags = self.natal._flags
+        sid_key = self.natal._sid_key
+        if memoize:
+            rows = [_calc_ut_cached(jd, planet_id, flags, sid_key) for jd in jd_vec.tolist()]
+        else:
+            if sid_key >= 0:
+                swe.set_sid_mode(sid_key)
+            rows = [swe.calc_ut(jd, planet_id, flags)[0] for jd in jd_vec.tolist()]
+        # One (T, 6) array per series instead of a position lookup per sample
+        data = np.array(rows, dtype=float).reshape(-1, 6)
+        return data[:, 0], data[:, 3]
+    
+    def _find_crossings(self, planet_id: int, jd0: float, span_days: float, step_days: float,
+                        targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find when a planet's longitude crosses each of the `targets` longitudes.
+        
+        The span is sampled every `step_days` and at every station inside it, so the
+        planet moves one way between consecutive samples and crosses a target at most
+        once per interval. Each bracketed crossing is refined with Illinois regula falsi.
+        
+        Returns (target index, days since jd0, speed) per crossing.
+        """
+        t = np.append(np.arange(0.0, span_days, step_days), span_days)
+        lon, speed = self._calculate_planet_series(jd0 + t, planet_id)
+        
+        # Stations: bisect each interval where the speed changes sign, then sample there too
+        station = np.nonzero(np.signbit(speed[:-1]) != np.signbit(speed[1:]))[0]
+        if station.size:
+            lo, hi = t[station], t[station + 1]
+            lo_retro = np.signbit(speed[station])
+            for _ in range(_MAX_ROOT_ITER):
+                if (hi - lo).max() <= _ROOT_TOL_DAYS:
+                    break
+                mid = (lo + hi) / 2
+                _, mid_speed = self._calculate_planet_series(jd0 + mid, planet_id, memoize=False)
+                before = np.signbit(mid_speed) == lo_retro
+                lo = np.where(before, mid, lo)
+                hi = np.where(before, hi, mid)
+            t_station = (lo + hi) / 2
+            lon_station, speed_station = self._calculate_planet_series(jd0 + t_station, planet_id,
+                                                                       memoize=False)
+            t = np.concatenate([t, t_station])
+            order = np.argsort(t, kind='stable')
+            t = t[order]
+            lon = np.concatenate([lon, lon_station])[order]
+            speed = np.concatenate([speed, speed_station])[order]
+        
+        # g[T, K] is the signed distance from each target to the planet. A crossing flips
+        # its sign by a small step; the far side of the circle flips it by ~360 degrees.
+        g = _signed_distance_raw(targets[None, :], lon[:, None])
+        negative = np.signbit(g)
+        steps, k = np.nonzero(negative[:-1] != negative[1:])
+        crossing = np.abs(g[steps + 1, k] - g[steps, k]) < 180
+        steps, k = steps[crossing], k[crossing]
+        
+        a, b = t[steps], t[steps + 1]
+        fa, fb = g[steps, k], g[steps + 1, k]
+        target = targets[k]
+        root, root_speed = a.copy(), speed[steps]
+        side = np.zeros(len(a), dtype=np.int8)
+        active = np.arange(len(a))
+        
+        for _ in range(_MAX_ROOT_ITER):
+            if active.size == 0:
+                break
+            ca, cb, cfa, cfb = a[active], b[active], fa[active], fb[active]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                c = (ca * cfb - cb * cfa) / (cfb - cfa)
+            c = np.where(np.isfinite(c), c, ca)
+            lon_c, speed_c = self._calculate_planet_series(jd0 + c, planet_id, memoize=False)
+            fc = _signed_distance_raw(target[active], lon_c)
+            root[active], root_speed[active] = c, speed_c
+            
+            # Illinois step: replace the end on fc's side and halve the other end's value
+            # when the same side is replaced twice running, so both ends keep closing in
+            left = np.signbit(fc) == np.signbit(cfa)
+            a[active] = np.where(left, c, ca)
+            fa[active] = np.where(left, fc, np.where(side[active] == -1, cfa / 2, cfa))
+            b[active] = np.where(left, cb, c)
+            fb[active] = np.where(left, np.where(side[active] == 1, cfb / 2, cfb), fc)
+            side[active] = np.where(left, 1, -1)
+            
+            # Converged once the time error |fc / speed| or the bracket is within tolerance
+            done = ((np.abs(fc) <= np.abs(speed_c) * _ROOT_TOL_DAYS) |
+                    (b[active] - a[active] <= _ROOT_TOL_DAYS))
+            active = active[~done]
+        
+        return k, root, root_speed
     
     def calculate_transits(self,
                           transit_date: datetime,
-                          timezone: Optional[Union[str, pytz.tzinfo.BaseTzInfo]] = None,
+                          timezone: Optional[Union[str, tzinfo]] = None,
                           include_minor_aspects: bool = False,
                           include_transit_to_transit: bool = False,
-                          orb_factor: float = 1.0) -> Dict:
-        """Calculate transit positions and aspects to natal chart."""
+                          orb_factor: float = 1.0,
+                          top_k: Optional[int] = None) -> Dict:
+        """
+        Calculate transit positions and aspects to natal chart.
+        
+        top_k keeps only the tightest top_k transit-to-natal aspects, for callers
+        that show just the first few.
+        """
         self.transit_date = transit_date
         
         tz = self.natal._parse_timezone(timezone)
@@ -627,7 +967,7 @@ class TransitChart:
         self.transit_julian_day = self.natal._calculate_julian_day(self.transit_date_utc)
         
         self._calculate_transit_planets()
-        self._calculate_transit_to_natal_aspects(include_minor_aspects, orb_factor)
+        self._calculate_transit_to_natal_aspects(include_minor_aspects, orb_factor, top_k)
         
         if include_transit_to_transit:
             self._calculate_transit_to_transit_aspects(include_minor_aspects, orb_factor)
@@ -640,12 +980,28 @@ class TransitChart:
             'transit_to_transit': self.transit_to_transit_aspects if include_transit_to_transit else [],
         }
     
+    def _build_natal_points(self) -> None:
+        """Collect natal planet and angle longitudes into parallel name/longitude arrays."""
+        natal = self.natal
+        houses = natal.houses
+        n_bodies = len(natal._planet_names)
+        
+        self._natal_names_arr = natal._planet_names + ['Natal ASC', 'Natal MC', 'Natal DSC',
+                                                       'Natal IC', 'Natal Vertex']
+        self._natal_lon_arr = np.append(natal._planet_lons[:n_bodies],
+                                        (houses['ascendant'], houses['mc'], houses['descendant'],
+                                         houses['ic'], houses['vertex']))
+        self._natal_cat_arr = np.array([_CATEGORY.get(n, 3) for n in self._natal_names_arr], dtype=np.intp)
+    
     def _calculate_transit_planets(self) -> None:
-        flags = self.natal._get_calc_flags()
+        flags = self.natal._flags
         self.transit_planets = {}
         
-        for name, planet_id in ChartConfig.PLANETS_CORE.items():
-            self._calculate_transit_body(name, planet_id, flags)
+        # Core planets and the node in one batch; the last row is the node
+        rows = _calc_ut_batch(self.transit_julian_day, _CORE_IDS + (self.natal._node_id,),
+                              flags, self.natal._sid_key).tolist()
+        for name, row in zip(ChartConfig.PLANETS_CORE, rows):
+            self._set_transit_body(name, row[0], row[3])
         
         for name, planet_id in ChartConfig.PLANETS_EXTENDED.items():
             try:
@@ -653,8 +1009,7 @@ class TransitChart:
             except:
                 pass
         
-        node_id = swe.TRUE_NODE if self.natal.node_type == NodeType.TRUE else swe.MEAN_NODE
-        self._calculate_transit_body('North Node', node_id, flags)
+        self._set_transit_body('North Node', rows[-1][0], rows[-1][3])
         
         nn = self.transit_planets['North Node']
         sn_long = normalize_degrees(nn['longitude'] + 180)
@@ -671,35 +1026,47 @@ class TransitChart:
         except:
             pass
         
-        for name in self.transit_planets:
-            self.transit_planets[name]['natal_house'] = self._get_transit_in_natal_house(name)
+        # Longitude/speed arrays parallel to self.transit_planets
+        n_bodies = len(self.transit_planets)
+        self._transit_lons = np.fromiter((p['longitude'] for p in self.transit_planets.values()),
+                                         dtype=np.float64, count=n_bodies)
+        self._transit_speeds = np.fromiter((p['speed'] for p in self.transit_planets.values()),
+                                           dtype=np.float64, count=n_bodies)
+        
+        houses = self.natal._houses_of(self._transit_lons)
+        for planet, house in zip(self.transit_planets.values(), houses):
+            planet['natal_house'] = house
+        
+        # Bodies taking part in each aspect pass, with their orb categories; the body
+        # list only changes if an extended body fails, so reuse them across dates
+        names = tuple(self.transit_planets)
+        if names != self._transit_names:
+            self._transit_names = names
+            self._bodies_t2n = [n for n in names if n not in {'Part of Fortune'}]
+            self._idx_t2n = np.array([i for i, n in enumerate(names)
+                                      if n not in {'Part of Fortune'}], dtype=np.intp)
+            self._cat_t2n = np.array([_CATEGORY.get(n, 3) for n in self._bodies_t2n], dtype=np.intp)
+            self._bodies_t2t = [n for n in names if n not in {'Part of Fortune', 'South Node'}]
+            self._idx_t2t = np.array([i for i, n in enumerate(names)
+                                      if n not in {'Part of Fortune', 'South Node'}], dtype=np.intp)
+            self._cat_t2t = np.array([_CATEGORY.get(n, 3) for n in self._bodies_t2t], dtype=np.intp)
+            self._max_orb_t2n.clear()
+            self._max_orb_t2t.clear()
     
     def _calculate_transit_body(self, name: str, body_id: int, flags: int) -> None:
-        result, _ = swe.calc_ut(self.transit_julian_day, body_id, flags)
-        sign_info = self.natal._get_sign_info(result[0])
-        
+        result = _calc_ut_cached(self.transit_julian_day, body_id, flags, self.natal._sid_key)
+        self._set_transit_body(name, result[0], result[3])
+    
+    def _set_transit_body(self, name: str, longitude: float, speed: float) -> None:
         self.transit_planets[name] = {
-            'longitude': result[0],
-            'speed': result[3],
-            'retrograde': result[3] < 0,
-            **sign_info,
+            'longitude': longitude,
+            'speed': speed,
+            'retrograde': speed < 0,
+            **self.natal._get_sign_info(longitude),
         }
     
     def _get_transit_in_natal_house(self, planet_name: str) -> int:
-        planet_long = normalize_degrees(self.transit_planets[planet_name]['longitude'])
-        cusps = self.natal.houses['cusps']
-        
-        for i in range(12):
-            cusp_start = normalize_degrees(cusps[i])
-            cusp_end = normalize_degrees(cusps[(i + 1) % 12])
-            
-            if cusp_start < cusp_end:
-                if cusp_start <= planet_long < cusp_end:
-                    return i + 1
-            else:
-                if planet_long >= cusp_start or planet_long < cusp_end:
-                    return i + 1
-        return 1
+        return house_of(self.transit_planets[planet_name]['longitude'], self.natal._cusps_np)
     
     def _is_transit_applying(self, transit_pos: float, transit_speed: float,
                              natal_pos: float, aspect_angle: float) -> bool:
@@ -709,116 +1076,113 @@ class TransitChart:
         APPLYING: Transit is moving toward exact aspect
         SEPARATING: Transit is moving away from exact aspect
         
-        This is simpler than natal-to-natal because the natal point is fixed.
+        This is simpler than natal-to-natal because the natal point is fixed:
+        the separation changes at sign(d) * transit_speed, with d the signed
+        distance from the natal point to the transit.
         """
-        # Current angular separation
-        sep = angular_distance(transit_pos, natal_pos)
-        current_orb = abs(sep - aspect_angle)
-        
-        # Predict where transit will be in small time step
-        future_pos = normalize_degrees(transit_pos + transit_speed * 0.1)  # 0.1 day ahead
-        future_sep = angular_distance(future_pos, natal_pos)
-        future_orb = abs(future_sep - aspect_angle)
-        
-        # Applying if orb is decreasing
-        return future_orb < current_orb
+        return is_applying(natal_pos, transit_pos, transit_speed, aspect_angle)
     
-    def _calculate_transit_to_natal_aspects(self, include_minor: bool, orb_factor: float) -> None:
+    def _calculate_transit_to_natal_aspects(self, include_minor: bool, orb_factor: float,
+                                            top_k: Optional[int] = None) -> None:
         self.transit_to_natal_aspects = []
         
-        transit_bodies = [name for name in self.transit_planets.keys()
-                         if name not in ['Part of Fortune']]
-        
-        # All natal points
-        natal_points = {}
-        for name, data in self.natal.planets.items():
-            natal_points[name] = data['longitude']
-        
-        natal_points['Natal ASC'] = self.natal.houses['ascendant']
-        natal_points['Natal MC'] = self.natal.houses['mc']
-        natal_points['Natal DSC'] = self.natal.houses['descendant']
-        natal_points['Natal IC'] = self.natal.houses['ic']
-        natal_points['Natal Vertex'] = self.natal.houses['vertex']
-        
-        for transit_name in transit_bodies:
-            transit_pos = self.transit_planets[transit_name]['longitude']
-            transit_speed = self.transit_planets[transit_name]['speed']
+        transit_bodies = self._bodies_t2n
+        natal_names = self._natal_names_arr
+        if not transit_bodies or not natal_names:
+            return
+        aspect_defs, angles, _, cat_orb = _ACTIVE_ASPECTS[bool(include_minor)]
+        append = self.transit_to_natal_aspects.append
+        
+        raw_lon = self._transit_lons[self._idx_t2n]
+        t_cat = self._cat_t2n
+        n_cat = self._natal_cat_arr
+        
+        # max_orb is (transit, natal, aspect); it only depends on the settings, so it
+        # is built once and reused across transit dates
+        key = (bool(include_minor), orb_factor)
+        max_orb = self._max_orb_t2n.get(key)
+        if max_orb is None:
+            max_orb = cat_orb[:, t_cat[:, None], n_cat[None, :]].transpose(1, 2, 0) * orb_factor
+            self._max_orb_t2n[key] = max_orb
+        
+        hit_t, hit_n, hit_a, hit_orb = find_aspects(raw_lon, self._natal_lon_arr, angles, max_orb)
+        hit_orbs = [round(v, 4) for v in hit_orb.tolist()]
+        
+        # Applying test of _is_transit_applying, for all hits at once
+        d = _signed_distance_raw(self._natal_lon_arr[hit_n], raw_lon[hit_t])
+        hit_applying = ((np.abs(d) - angles[hit_a]) * d * self._transit_speeds[self._idx_t2n][hit_t] < 0).tolist()
+        
+        # Emit hits already ordered by rounded orb; the stable sort keeps ties in scan order.
+        # nsmallest is stable too and only orders the top_k needed.
+        if top_k is None:
+            order = np.argsort(hit_orbs, kind='stable')
+        else:
+            order = heapq.nsmallest(top_k, range(len(hit_orbs)), key=hit_orbs.__getitem__)
+        for h in order:
+            i, j, a = hit_t[h], hit_n[h], hit_a[h]
+            transit_name = transit_bodies[i]
+            transit = self.transit_planets[transit_name]
+            aspect_def = aspect_defs[a]
             
-            for natal_name, natal_pos in natal_points.items():
-                sep = angular_distance(transit_pos, natal_pos)
-                
-                for aspect_def in ChartConfig.ASPECTS:
-                    if not aspect_def.major and not include_minor:
-                        continue
-                    
-                    orb = abs(sep - aspect_def.angle)
-                    
-                    cat1 = self.natal._get_planet_category(transit_name)
-                    cat2 = self.natal._get_planet_category(natal_name)
-                    max_orb = min(aspect_def.transit_orbs[cat1], aspect_def.transit_orbs[cat2]) * orb_factor
-                    
-                    if orb <= max_orb:
-                        applying = self._is_transit_applying(
-                            transit_pos, transit_speed, natal_pos, aspect_def.angle
-                        )
-                        
-                        self.transit_to_natal_aspects.append({
-                            'transit_planet': transit_name,
-                            'natal_planet': natal_name,
-                            'aspect': aspect_def.name,
-                            'symbol': aspect_def.symbol,
-                            'angle': aspect_def.angle,
-                            'orb': round(orb, 4),
-                            'max_orb': max_orb,
-                            'applying': applying,
-                            'major': aspect_def.major,
-                            'transit_retrograde': self.transit_planets[transit_name]['retrograde'],
-                            'transit_house': self.transit_planets[transit_name]['natal_house'],
-                        })
-        
-        self.transit_to_natal_aspects.sort(key=lambda x: x['orb'])
+            append(AspectHit(
+                transit_planet=transit_name,
+                natal_planet=natal_names[j],
+                aspect=aspect_def.name,
+                symbol=aspect_def.symbol,
+                angle=aspect_def.angle,
+                orb=hit_orbs[h],
+                max_orb=float(max_orb[i, j, a]),
+                applying=hit_applying[h],
+                major=aspect_def.major,
+                transit_retrograde=transit['retrograde'],
+                transit_house=transit['natal_house'],
+            ))
     
     def _calculate_transit_to_transit_aspects(self, include_minor: bool, orb_factor: float) -> None:
         self.transit_to_transit_aspects = []
         
-        transit_bodies = [name for name in self.transit_planets.keys()
-                         if name not in ['Part of Fortune', 'South Node']]
-        
-        for i, name1 in enumerate(transit_bodies):
-            for name2 in transit_bodies[i + 1:]:
-                pos1 = self.transit_planets[name1]['longitude']
-                pos2 = self.transit_planets[name2]['longitude']
-                speed1 = self.transit_planets[name1]['speed']
-                speed2 = self.transit_planets[name2]['speed']
-                
-                sep = angular_distance(pos1, pos2)
-                
-                for aspect_def in ChartConfig.ASPECTS:
-                    if not aspect_def.major and not include_minor:
-                        continue
-                    
-                    orb = abs(sep - aspect_def.angle)
-                    cat1 = self.natal._get_planet_category(name1)
-                    cat2 = self.natal._get_planet_category(name2)
-                    max_orb = min(aspect_def.transit_orbs[cat1], aspect_def.transit_orbs[cat2]) * orb_factor
-                    
-                    if orb <= max_orb:
-                        applying = self.natal._calculate_natal_applying(
-                            pos1, pos2, speed1, speed2, aspect_def.angle
-                        )
-                        
-                        self.transit_to_transit_aspects.append({
-                            'planet1': name1,
-                            'planet2': name2,
-                            'aspect': aspect_def.name,
-                            'symbol': aspect_def.symbol,
-                            'angle': aspect_def.angle,
-                            'orb': round(orb, 4),
-                            'applying': applying,
-                            'major': aspect_def.major,
-                        })
-        
-        self.transit_to_transit_aspects.sort(key=lambda x: x['orb'])
+        transit_bodies = self._bodies_t2t
+        aspect_defs, angles, _, cat_orb = _ACTIVE_ASPECTS[bool(include_minor)]
+        if len(transit_bodies) < 2 or not aspect_defs:
+            return
+        append = self.transit_to_transit_aspects.append
+        
+        lon = self._transit_lons[self._idx_t2t]
+        cats = self._cat_t2t
+        
+        # max_orb is (transit1, transit2, aspect), disabled below the diagonal so
+        # only the unique pairs i < j are scanned, in nested-loop order; built once
+        # per settings like the transit-to-natal table
+        key = (bool(include_minor), orb_factor)
+        max_orb = self._max_orb_t2t.get(key)
+        if max_orb is None:
+            max_orb = cat_orb[:, cats[:, None], cats[None, :]].transpose(1, 2, 0) * orb_factor
+            max_orb[np.tril_indices(len(transit_bodies))] = -1.0
+            self._max_orb_t2t[key] = max_orb
+        
+        i1, i2, hit_a, hit_orb = find_aspects(lon, lon, angles, max_orb)
+        hit_orbs = [round(v, 4) for v in hit_orb.tolist()]
+        
+        # Applying test of _calculate_natal_applying, for all hits at once; two stationary
+        # bodies give a zero rate and so are never applying
+        speeds = self._transit_speeds[self._idx_t2t]
+        d = _signed_distance_raw(lon[i2], lon[i1])
+        hit_applying = ((np.abs(d) - angles[hit_a]) * d * (speeds[i1] - speeds[i2]) < 0).tolist()
+        
+        # Emit hits already ordered by rounded orb; the stable sort keeps ties in scan order
+        for h in np.argsort(hit_orbs, kind='stable'):
+            aspect_def = aspect_defs[hit_a[h]]
+            
+            append({
+                'planet1': transit_bodies[i1[h]],
+                'planet2': transit_bodies[i2[h]],
+                'aspect': aspect_def.name,
+                'symbol': aspect_def.symbol,
+                'angle': aspect_def.angle,
+                'orb': hit_orbs[h],
+                'applying': hit_applying[h],
+                'major': aspect_def.major,
+            })
     
     def find_exact_transits(self,
                            start_date: datetime,
@@ -827,129 +1191,143 @@ class TransitChart:
                            planets: Optional[List[str]] = None,
                            aspects: Optional[List[str]] = None,
                            natal_points: Optional[List[str]] = None) -> List[TransitEvent]:
+        """Find dates when transits become exact within a date range, as a list."""
+        return list(self.iter_exact_transits(start_date, end_date, timezone, planets, aspects, natal_points))
+    
+    def iter_exact_transits(self,
+                            start_date: datetime,
+                            end_date: datetime,
+                            timezone: Optional[str] = None,
+                            planets: Optional[List[str]] = None,
+                            aspects: Optional[List[str]] = None,
+                            natal_points: Optional[List[str]] = None) -> Iterator[TransitEvent]:
         """
-        Find dates when transits become exact within a date range.
+        Yield the dates when transits become exact within a date range, in date order.
         
         Uses an improved algorithm that:
         1. Tracks when transit crosses exact aspect points
         2. Handles retrograde motion correctly
         3. Uses appropriate step sizes for different planets
-        """
-        events = []
-        
-        if aspects is None:
-            aspects = ['Conjunction', 'Sextile', 'Square', 'Trine', 'Opposition']
         
+        The search completes before the first event is yielded, so errors surface
+        on the first next(); event objects are only built as they are consumed.
+        """
         if planets is None:
             planets = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars',
                       'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']
         
+        # Get natal positions; the default set is the natal bodies plus ASC and MC,
+        # the leading entries of the natal point arrays
         if natal_points is None:
-            natal_points = list(self.natal.planets.keys()) + ['Natal ASC', 'Natal MC']
-        
-        # Get natal positions
-        natal_positions = {}
-        for name in natal_points:
-            if name == 'Natal ASC':
-                natal_positions[name] = self.natal.houses['ascendant']
-            elif name == 'Natal MC':
-                natal_positions[name] = self.natal.houses['mc']
-            elif name == 'Natal DSC':
-                natal_positions[name] = self.natal.houses['descendant']
-            elif name == 'Natal IC':
-                natal_positions[name] = self.natal.houses['ic']
-            elif name == 'Natal Vertex':
-                natal_positions[name] = self.natal.houses['vertex']
-            elif name in self.natal.planets:
-                natal_positions[name] = self.natal.planets[name]['longitude']
-        
-        # Get aspect definitions
-        aspect_defs = {a.name: a for a in ChartConfig.ASPECTS if a.name in aspects}
-        
-        # Step size depends on fastest planet
-        has_moon = 'Moon' in planets
-        step_hours = 2 if has_moon else 6
+            n_default = len(self.natal._planet_names) + 2
+            natal_positions = dict(zip(self._natal_names_arr[:n_default],
+                                       self._natal_lon_arr[:n_default].tolist()))
+        else:
+            natal_positions = {}
+            for name in natal_points:
+                if name == 'Natal ASC':
+                    natal_positions[name] = self.natal.houses['ascendant']
+                elif name == 'Natal MC':
+                    natal_positions[name] = self.natal.houses['mc']
+                elif name == 'Natal DSC':
+                    natal_positions[name] = self.natal.houses['descendant']
+                elif name == 'Natal IC':
+                    natal_positions[name] = self.natal.houses['ic']
+                elif name == 'Natal Vertex':
+                    natal_positions[name] = self.natal.houses['vertex']
+                elif name in self.natal.planets:
+                    natal_positions[name] = self.natal.planets[name]['longitude']
+        
+        # Get aspect definitions; the default is the major aspects
+        if aspects is None:
+            active_aspects = ChartConfig.ASPECTS_MAJOR
+        else:
+            aspects_set = frozenset(aspects)
+            active_aspects = [a for a in ChartConfig.ASPECTS_ALL if a.name in aspects_set]
         
         tz = self.natal._parse_timezone(timezone)
         
-        # Track previous orbs to detect exact crossings
-        prev_data = {}  # key -> (orb, separation)
+        # Search in days since the UTC start; roots map back to integer microseconds
+        start_utc = self.natal._convert_to_utc(start_date, tz)
+        end_utc = self.natal._convert_to_utc(end_date, tz)
+        span_us = (end_utc - start_utc) // timedelta(microseconds=1)
+        start_us = np.datetime64(start_utc.replace(tzinfo=None), 'us')
+        jd0 = _UNIX_EPOCH_JD + start_us.astype(np.int64) / 86_400_000_000
+        span_days = span_us / 86_400_000_000
+        
+        # Events are reported in the same frame as start_date
+        if start_date.tzinfo is not None:
+            out_tz, keep_tzinfo = start_date.tzinfo, True
+        else:
+            out_tz, keep_tzinfo = tz or UTC, False
+        
+        planet_ids = [(name, ChartConfig.PLANETS_CORE[name]) for name in dict.fromkeys(planets)
+                      if name in ChartConfig.PLANETS_CORE]
+        if not planet_ids or span_us <= 0:
+            return
+        
+        # Exact aspects happen where the transit crosses a natal point shifted by
+        # +/- the aspect angle; conjunctions and oppositions have a single such point
+        # combo_meta holds each (natal point, aspect name, aspect symbol) combination
+        # and target_combo the combination index of every target
+        target_lon, target_combo, combo_meta = [], [], []
+        for name, natal_lon in natal_positions.items():
+            for aspect_def in active_aspects:
+                combo = len(combo_meta)
+                combo_meta.append((name, aspect_def.name, aspect_def.symbol))
+                offsets = (aspect_def.angle,) if aspect_def.angle in (0, 180) else (aspect_def.angle, -aspect_def.angle)
+                for offset in offsets:
+                    target_lon.append(natal_lon + offset)
+                    target_combo.append(combo)
+        targets = np.array(target_lon, dtype=float) % 360
+        
+        crossings = [self._find_crossings(planet_id, jd0, span_days,
+                                          _SEARCH_STEP_DAYS.get(name, _SEARCH_STEP_DEFAULT), targets)
+                     for name, planet_id in planet_ids]
+        
+        days = np.concatenate([c[1] for c in crossings])
+        exact_utc = start_us + np.rint(days * 86_400_000_000).astype(np.int64).astype('m8[us]')
+        if keep_tzinfo:
+            exact_times = [t.replace(tzinfo=UTC).astimezone(out_tz) for t in exact_utc.tolist()]
+        else:
+            exact_times = _local_naive_times(exact_utc, out_tz)
         
-        current = start_date
-        while current <= end_date:
-            current_utc = self.natal._convert_to_utc(current, tz)
-            jd = self.natal._calculate_julian_day(current_utc)
-            
-            for transit_name in planets:
-                if transit_name not in ChartConfig.PLANETS_CORE:
-                    continue
-                
-                planet_id = ChartConfig.PLANETS_CORE[transit_name]
-                transit_pos, transit_speed = self._calculate_planet_position(jd, planet_id)
-                transit_retro = transit_speed < 0
-                
-                for natal_name, natal_pos in natal_positions.items():
-                    sep = angular_distance(transit_pos, natal_pos)
-                    
-                    for aspect_name, aspect_def in aspect_defs.items():
-                        orb = abs(sep - aspect_def.angle)
-                        key = (transit_name, natal_name, aspect_name)
-                        
-                        if key in prev_data:
-                            prev_orb, prev_sep = prev_data[key]
-                            
-                            # Detect crossing: orb decreased then would increase, or reached minimum
-                            if prev_orb > orb:
-                                # Still approaching - update
-                                pass
-                            elif prev_orb < orb and prev_orb < 1.0:
-                                # Was approaching, now separating - exact was between
-                                # Interpolate to find exact time
-                                if prev_orb < 0.5:  # Only record if it was close
-                                    fraction = prev_orb / (prev_orb + orb) if (prev_orb + orb) > 0 else 0.5
-                                    exact_time = current - timedelta(hours=step_hours * (1 - fraction))
-                                    
-                                    events.append(TransitEvent(
-                                        transit_planet=transit_name,
-                                        natal_planet=natal_name,
-                                        aspect=aspect_name,
-                                        aspect_symbol=aspect_def.symbol,
-                                        exact_date=exact_time,
-                                        orb=0.0,
-                                        applying=False,
-                                        transit_retrograde=transit_retro,
-                                    ))
-                        
-                        prev_data[key] = (orb, sep)
-            
-            current += timedelta(hours=step_hours)
+        planet_all = np.repeat(np.arange(len(planet_ids)), [c[0].size for c in crossings]).tolist()
+        combo_all = np.take(target_combo, np.concatenate([c[0] for c in crossings])).tolist()
+        retrograde_all = (np.concatenate([c[2] for c in crossings]) < 0).tolist()
         
         # Remove duplicates - keep only one event per transit-natal-aspect combo
-        # within a reasonable window (2 days for fast planets, longer for slow)
-        unique_events = []
-        for event in sorted(events, key=lambda x: x.exact_date):
-            is_dup = False
-            
-            # Window size depends on planet speed
-            # Moon: 6 hours, Sun/Mercury/Venus/Mars: 1 day, outer: 3 days
-            if event.transit_planet == 'Moon':
-                window_seconds = 6 * 3600
-            elif event.transit_planet in ['Sun', 'Mercury', 'Venus', 'Mars']:
-                window_seconds = 24 * 3600
-            else:
-                window_seconds = 72 * 3600
-            
-            for existing in unique_events:
-                if (event.transit_planet == existing.transit_planet and
-                    event.natal_planet == existing.natal_planet and
-                    event.aspect == existing.aspect and
-                    abs((event.exact_date - existing.exact_date).total_seconds()) < window_seconds):
-                    is_dup = True
-                    break
-            if not is_dup:
-                unique_events.append(event)
-        
-        return unique_events
+        # within a reasonable window (6 hours for the Moon, longer for slower planets).
+        # Crossings are thinned by index, so only the kept ones become events.
+        groups = defaultdict(list)
+        for idx, key in enumerate(zip(planet_all, combo_all)):
+            groups[key].append(idx)
+        
+        date_of = exact_times.__getitem__
+        kept = []
+        for (p, _), group in groups.items():
+            window = timedelta(seconds=_DEDUP_WINDOW_SECONDS.get(planet_ids[p][0], _DEDUP_WINDOW_DEFAULT))
+            group.sort(key=date_of)
+            last_date = exact_times[group[0]]
+            kept.append(group[0])
+            for idx in group[1:]:
+                if exact_times[idx] - last_date >= window:
+                    last_date = exact_times[idx]
+                    kept.append(idx)
+        kept.sort(key=date_of)
+        
+        for idx in kept:
+            natal_name, aspect_name, aspect_symbol = combo_meta[combo_all[idx]]
+            yield TransitEvent(
+                transit_planet=planet_ids[planet_all[idx]][0],
+                natal_planet=natal_name,
+                aspect=aspect_name,
+                aspect_symbol=aspect_symbol,
+                exact_date=exact_times[idx],
+                orb=0.0,
+                applying=False,
+                transit_retrograde=retrograde_all[idx],
+            )
     
     def format_transit_text(self) -> str:
         if not self.transit_planets:
@@ -984,11 +1362,8 @@ class TransitChart:
         lines.append("-" * 75)
         
         if self.transit_to_natal_aspects:
-            for asp in self.transit_to_natal_aspects[:25]:
-                status = "applying" if asp['applying'] else "separating"
-                retro = " (R)" if asp['transit_retrograde'] else ""
-                lines.append(f"  T.{asp['transit_planet']:<10}{retro} {asp['symbol']} "
-                           f"N.{asp['natal_planet']:<14} orb {asp['orb']:5.2f}° ({status})")
+            lines.extend(_T2N_ROW.format(asp, _RETRO_MARK[asp.transit_retrograde], _MOTION_STATUS[asp.applying])
+                         for asp in self.transit_to_natal_aspects[:25])
         else:
             lines.append("  No transit aspects within orb")
         
@@ -996,10 +1371,8 @@ class TransitChart:
             lines.append("")
             lines.append("TRANSIT-TO-TRANSIT ASPECTS")
             lines.append("-" * 75)
-            for asp in self.transit_to_transit_aspects[:10]:
-                status = "applying" if asp['applying'] else "separating"
-                lines.append(f"  {asp['planet1']:<12} {asp['symbol']} {asp['planet2']:<12} "
-                           f"orb {asp['orb']:5.2f}° ({status})")
+            lines.extend(_T2T_ROW.format_map({**asp, 'status': _MOTION_STATUS[asp['applying']]})
+                         for asp in self.transit_to_transit_aspects[:10])
         
         return "\n".join(lines)
 
@@ -1053,6 +1426,7 @@ if __name__ == "__main__":
         timezone='America/New_York',
         include_minor_aspects=False,
         include_transit_to_transit=True,
+        top_k=25,
     )
     
     print(transit_calc.format_transit_text())
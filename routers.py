@@ -1,12 +1,29 @@
 """API routers for Swiss Ephemeris API."""
 
-from fastapi import APIRouter, HTTPException
-import pytz
+import asyncio
+import functools
+import hashlib
+import itertools
+import multiprocessing
+import os
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from zoneinfo import available_timezones
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+import orjson
+import swisseph as swe
 
 from models import (
     NatalChartRequest,
     NatalChartBatchRequest,
     TransitCalculationRequest,
+    TransitDateInput,
     TransitBatchRequest,
     ExactTransitsRequest,
     NatalChartResponse,
@@ -16,7 +33,6 @@ from models import (
     BatchResultItem,
     BatchSummary,
     ErrorDetail,
-    TransitEventData,
     ConfigHouseSystemsResponse,
     ConfigAspectsResponse,
     AspectDefinitionResponse,
@@ -29,62 +45,405 @@ from natal import (
     ZodiacType,
     PartOfFortuneFormula,
 )
-from exceptions import InvalidCoordinatesError, InvalidTimezoneError, ChartCalculationError
+from exceptions import (
+    SwissEphAPIException,
+    InvalidCoordinatesError,
+    InvalidTimezoneError,
+    ChartCalculationError,
+)
 
 router = APIRouter()
 
+# Calculator enum member per request value. The request enums are str enums, so
+# their members look up these value-keyed dicts directly.
+_NODE_TYPES = {member.value: member for member in NodeType}
+_ZODIAC_TYPES = {member.value: member for member in ZodiacType}
+_POF_FORMULAS = {member.value: member for member in PartOfFortuneFormula}
+
+# IANA names known to zoneinfo, for validating request timezones with a set lookup
+_TZ_SET = frozenset(available_timezones())
+
+# Single natal chart requests arriving within BATCH_WINDOW_MS of each other are
+# coalesced, up to BATCH_MAX_SIZE at a time, and dispatched to the process pool
+# together. The queue exists while run_natal_coalescer is running; a window of 0
+# disables coalescing and requests run in the threadpool.
+_COALESCE_WINDOW_S = float(os.environ.get("BATCH_WINDOW_MS", "5")) / 1000
+_COALESCE_MAX_SIZE = int(os.environ.get("BATCH_MAX_SIZE", "64"))
+_natal_queue: asyncio.Queue | None = None
+_natal_dispatches: set[asyncio.Task] = set()
+
+_exact_date_key = attrgetter("exact_date")
+
+# Chart used to exercise the calculators once at startup
+_PREWARM_REQUEST = NatalChartRequest(birth_date=datetime(2000, 1, 1, 12), latitude=0.0, longitude=0.0)
+
 
 # Helper Functions
+@functools.lru_cache(maxsize=1024)
+def _natal_chart_cached(birth_date_iso: str, latitude: float, longitude: float, house_system: str,
+                        timezone: str | None, node_type: NodeType, zodiac_type: ZodiacType,
+                        include_minor_aspects: bool, sidereal_mode: int,
+                        pof_formula: PartOfFortuneFormula) -> NatalChart:
+    """
+    Build and fully calculate a natal chart, memoized on its inputs.
+
+    The birth date is keyed by its ISO string: equal instants with different
+    UTC offsets compare equal as datetimes but are different requests. The
+    chart is calculated before it is cached, so requests sharing it only read it.
+    """
+    chart = NatalChart(
+        birth_date=datetime.fromisoformat(birth_date_iso),
+        latitude=latitude,
+        longitude=longitude,
+        house_system=house_system,
+        timezone=timezone,
+        node_type=node_type,
+        zodiac_type=zodiac_type,
+        include_minor_aspects=include_minor_aspects,
+        sidereal_mode=sidereal_mode,
+        pof_formula=pof_formula
+    )
+    chart.generate_full_chart()
+    return chart
+
+
 def _build_natal_chart(request: NatalChartRequest) -> NatalChart:
-    """Convert request model to NatalChart instance."""
+    """
+    Convert request model to a calculated NatalChart instance.
+
+    Identical requests share one cached chart, which callers must not modify.
+    """
+    # An empty set means no system tz database; NatalChart then falls back to pytz
+    if request.timezone is not None and _TZ_SET and request.timezone not in _TZ_SET:
+        raise InvalidTimezoneError(f"Unknown timezone: {request.timezone}")
     try:
-        return NatalChart(
-            birth_date=request.birth_date,
-            latitude=request.latitude,
-            longitude=request.longitude,
-            house_system=request.house_system.value,
-            timezone=request.timezone,
-            node_type=NodeType(request.node_type.value),
-            zodiac_type=ZodiacType(request.zodiac_type.value),
-            include_minor_aspects=request.include_minor_aspects,
-            sidereal_mode=request.sidereal_mode,
-            pof_formula=PartOfFortuneFormula(request.pof_formula.value)
+        chart = _natal_chart_cached(
+            request.birth_date.isoformat(),
+            request.latitude,
+            request.longitude,
+            request.house_system.value,
+            request.timezone,
+            _NODE_TYPES[request.node_type],
+            _ZODIAC_TYPES[request.zodiac_type],
+            request.include_minor_aspects,
+            request.sidereal_mode,
+            _POF_FORMULAS[request.pof_formula]
         )
     except ValueError as e:
         raise InvalidCoordinatesError(str(e))
-    except pytz.exceptions.UnknownTimeZoneError as e:
-        raise InvalidTimezoneError(f"Unknown timezone: {request.timezone}")
+    except swe.Error:
+        # Placidus and Koch cusps are undefined beyond 90 - obliquity degrees of latitude
+        raise InvalidCoordinatesError(
+            f"{request.house_system.value} houses are undefined at latitude {request.latitude}")
+    # Swiss Ephemeris settings are per thread; the cached chart may come from another
+    chart._init_ephemeris(chart.ephemeris_path)
+    return chart
 
 
-def _convert_transit_events(events: list) -> list[TransitEventData]:
-    """Convert TransitEvent dataclass instances to Pydantic models."""
-    return [
-        TransitEventData(
-            transit_planet=event.transit_planet,
-            natal_planet=event.natal_planet,
-            aspect=event.aspect,
-            aspect_symbol=event.aspect_symbol,
-            exact_date=event.exact_date,
-            orb=event.orb,
-            applying=event.applying,
-            transit_retrograde=event.transit_retrograde
-        )
-        for event in events
+def _calculate_natal(request: NatalChartRequest) -> NatalChartResponse:
+    """Calculate a single natal chart, raising the API exception for any failure."""
+    try:
+        chart = _build_natal_chart(request)
+        result = chart.generate_full_chart()
+        return NatalChartResponse(**result)
+    except (InvalidCoordinatesError, InvalidTimezoneError):
+        raise
+    except Exception as e:
+        raise ChartCalculationError(f"Chart calculation failed: {str(e)}")
+
+
+def _worker_natal_run(chart_reqs: list[NatalChartRequest]) -> list:
+    """Calculate a run of coalesced natal charts in a pool worker; errors are returned, not raised."""
+    outcomes = []
+    for chart_req in chart_reqs:
+        try:
+            outcomes.append(_calculate_natal(chart_req))
+        except SwissEphAPIException as e:
+            outcomes.append(e)
+    return outcomes
+
+
+async def _dispatch_natal(batch: list[tuple[NatalChartRequest, asyncio.Future]]) -> None:
+    """Calculate a coalesced batch in the process pool and resolve each request's future."""
+    run_size = max(1, -(-len(batch) // (os.cpu_count() or 1)))
+    starts = range(0, len(batch), run_size)
+    runs = await asyncio.gather(*[
+        _run_in_pool(_worker_natal_run, [chart_req for chart_req, _ in batch[start:start + run_size]])
+        for start in starts
+    ], return_exceptions=True)
+    # A failed run (such as a dead pool worker) fails only its own requests
+    runs = [
+        [ChartCalculationError(f"Chart calculation failed: {str(run)}")
+         for _ in batch[start:start + run_size]] if isinstance(run, Exception) else run
+        for start, run in zip(starts, runs)
     ]
 
+    for (_, future), outcome in zip(batch, (outcome for run in runs for outcome in run)):
+        if future.done():  # The client went away
+            continue
+        if isinstance(outcome, Exception):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+
+
+async def run_natal_coalescer() -> None:
+    """Collect queued single natal chart requests into batches until cancelled."""
+    global _natal_queue
+    if _COALESCE_WINDOW_S <= 0:
+        return
+    queue = _natal_queue = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + _COALESCE_WINDOW_S
+            while len(batch) < _COALESCE_MAX_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+            task = asyncio.create_task(_dispatch_natal(batch))
+            _natal_dispatches.add(task)
+            task.add_done_callback(_natal_dispatches.discard)
+    finally:
+        _natal_queue = None
+
+
+def prewarm() -> None:
+    """
+    Run one natal, transit and exact transit calculation.
+
+    Compiles the numba kernels (or loads them from numba's on-disk cache) and
+    opens the ephemeris files, so the first request does not pay for either.
+    """
+    transit_calc = TransitChart(_build_natal_chart(_PREWARM_REQUEST))
+    start = _PREWARM_REQUEST.birth_date
+    transit_calc.calculate_transits(transit_date=start, include_minor_aspects=True,
+                                    include_transit_to_transit=True)
+    transit_calc.find_exact_transits(start_date=start, end_date=start + timedelta(days=1))
+
+
+# Batch items are computed in worker processes: Swiss Ephemeris holds the GIL, so
+# threads cannot run charts in parallel. Workers are spawned rather than forked
+# from the threaded server process, and prewarm once as they start. The app
+# lifespan starts and shuts down the pool; without it the pool starts on first use.
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the worker process pool, creating it if needed."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                            mp_context=multiprocessing.get_context("spawn"),
+                                            initializer=prewarm)
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the worker process pool, if one is running."""
+    global _process_pool
+    pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_in_pool(func, *args):
+    """
+    Run func(*args) in the worker process pool.
+
+    A worker that dies (out of memory, or a crash in the C extension) breaks the
+    whole executor. The broken pool is then replaced, so only the calls already
+    in flight fail.
+    """
+    pool = _get_process_pool()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        if pool is _process_pool:
+            shutdown_process_pool()
+        raise
+
+
+async def start_process_pool() -> None:
+    """Start the pool and spawn every worker now, so none starts up while serving a request."""
+    await asyncio.gather(*[_run_in_pool(os.getpid) for _ in range(os.cpu_count() or 1)])
+
+
+def _quick_validate(chart_req: NatalChartRequest) -> dict | None:
+    """
+    Return a batch error outcome for input that is certain to fail, or None.
+
+    Runs before a chart is sent to the process pool, so predictable input errors
+    cost a set lookup instead of a worker round trip and an exception.
+    """
+    if chart_req.timezone is not None and _TZ_SET and chart_req.timezone not in _TZ_SET:
+        return {"err": ("InvalidTimezoneError", f"Unknown timezone: {chart_req.timezone}")}
+    return None
+
+
+def _worker_natal(chart_req: NatalChartRequest) -> dict:
+    """Calculate one batch natal chart in a pool worker; errors are returned, not raised."""
+    try:
+        return {"ok": _build_natal_chart(chart_req).generate_full_chart()}
+    except Exception as e:
+        return {"err": (type(e).__name__, str(e))}
+
+
+def _worker_transits(natal_req: NatalChartRequest, transit_inputs: list[TransitDateInput],
+                     include_minor_aspects: bool, include_transit_to_transit: bool,
+                     orb_factor: float) -> list[dict]:
+    """Calculate a run of batch transit dates against one natal chart in a pool worker."""
+    transit_calc = TransitChart(_build_natal_chart(natal_req))
+    outcomes = []
+    for transit_input in transit_inputs:
+        try:
+            outcomes.append({"ok": transit_calc.calculate_transits(
+                transit_date=transit_input.date,
+                timezone=transit_input.timezone,
+                include_minor_aspects=include_minor_aspects,
+                include_transit_to_transit=include_transit_to_transit,
+                orb_factor=orb_factor
+            )})
+        except Exception as e:
+            outcomes.append({"err": (type(e).__name__, str(e))})
+    return outcomes
+
+
+def _worker_exact_transits(natal_req: NatalChartRequest, planet: str, start_date: datetime,
+                           end_date: datetime, timezone: str | None, aspects: list[str] | None,
+                           natal_points: list[str] | None) -> list:
+    """Search one transiting planet's exact transits in a pool worker."""
+    transit_calc = TransitChart(_build_natal_chart(natal_req))
+    return transit_calc.find_exact_transits(
+        start_date=start_date,
+        end_date=end_date,
+        timezone=timezone,
+        planets=[planet],
+        aspects=aspects,
+        natal_points=natal_points
+    )
+
+
+@dataclass(slots=True)
+class _BatchItem:
+    """In-flight batch result, mirroring BatchResultItem without a per-item __dict__."""
+    id: str
+    success: bool
+    data: NatalChartResponse | TransitResponse | None = None
+    error: ErrorDetail | None = None
+
+
+def _batch_item(item_id: str, outcome: dict, response_model) -> _BatchItem:
+    """
+    Convert a pool worker outcome to a batch result item.
+
+    Only the calculator data is validated; the error model is built with
+    model_construct since its fields are plain values.
+    """
+    if "ok" in outcome:
+        try:
+            return _BatchItem(item_id, True, data=response_model(**outcome["ok"]))
+        except Exception as e:
+            outcome = {"err": (type(e).__name__, str(e))}
+    error_type, message = outcome["err"]
+    return _BatchItem(item_id, False, error=ErrorDetail.model_construct(
+        type=error_type,
+        message=message,
+        detail=None
+    ))
+
+
+def _batch_response(results: list[_BatchItem]) -> BatchResponse:
+    """
+    Convert batch result items to their response models and add the summary.
+    Failures are counted by difference.
+    """
+    total = len(results)
+    successful = sum(item.success for item in results)
+    return BatchResponse.model_construct(
+        results=[
+            BatchResultItem.model_construct(id=item.id, success=item.success,
+                                            data=item.data, error=item.error)
+            for item in results
+        ],
+        summary=BatchSummary.model_construct(
+            total=total,
+            successful=successful,
+            failed=total - successful
+        )
+    )
+
 
 # Configuration Endpoints
+def _aspect_definition(asp) -> AspectDefinitionResponse:
+    """Convert a ChartConfig aspect definition to its response model."""
+    return AspectDefinitionResponse(
+        name=asp.name,
+        symbol=asp.symbol,
+        angle=asp.angle,
+        natal_orbs={
+            "luminary": asp.natal_orbs[0],
+            "personal": asp.natal_orbs[1],
+            "social": asp.natal_orbs[2],
+            "outer": asp.natal_orbs[3]
+        },
+        transit_orbs={
+            "luminary": asp.transit_orbs[0],
+            "personal": asp.transit_orbs[1],
+            "social": asp.transit_orbs[2],
+            "outer": asp.transit_orbs[3]
+        }
+    )
+
+
+# The configuration is static for the life of the process: serialize it once
+_HOUSE_SYSTEMS_JSON = ConfigHouseSystemsResponse(
+    house_systems=list(ChartConfig.HOUSE_SYSTEMS.keys())
+).model_dump_json().encode()
+
+_ASPECTS_JSON = ConfigAspectsResponse(
+    major_aspects=[_aspect_definition(asp) for asp in ChartConfig.ASPECTS_MAJOR],
+    minor_aspects=[_aspect_definition(asp) for asp in ChartConfig.ASPECTS_MINOR]
+).model_dump_json().encode()
+
+
+def _config_headers(body: bytes) -> dict[str, str]:
+    """Caching headers for a static config body, with a strong ETag from its content."""
+    return {
+        "Cache-Control": "public, max-age=86400",
+        "ETag": f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"',
+    }
+
+
+_HOUSE_SYSTEMS_HEADERS = _config_headers(_HOUSE_SYSTEMS_JSON)
+_ASPECTS_HEADERS = _config_headers(_ASPECTS_JSON)
+
+
+def _config_response(request: Request, body: bytes, headers: dict[str, str]) -> Response:
+    """Serve a static config body, or 304 Not Modified when the client's copy is current."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match uses weak comparison, so a W/ prefix still matches
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if headers["ETag"] in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get(
     "/config/house-systems",
     response_model=ConfigHouseSystemsResponse,
     summary="List Available House Systems",
     description="Get a list of all supported house systems for natal chart calculations."
 )
-async def get_house_systems():
+async def get_house_systems(request: Request):
     """List all available house systems."""
-    return ConfigHouseSystemsResponse(
-        house_systems=list(ChartConfig.HOUSE_SYSTEMS.keys())
-    )
+    return _config_response(request, _HOUSE_SYSTEMS_JSON, _HOUSE_SYSTEMS_HEADERS)
 
 
 @router.get(
@@ -99,54 +458,9 @@ async def get_house_systems():
     - Categorized by major and minor aspects
     """
 )
-async def get_aspects():
+async def get_aspects(request: Request):
     """List all aspect definitions with orb information."""
-    major = [
-        AspectDefinitionResponse(
-            name=asp.name,
-            symbol=asp.symbol,
-            angle=asp.angle,
-            natal_orbs={
-                "luminary": asp.natal_orbs[0],
-                "personal": asp.natal_orbs[1],
-                "social": asp.natal_orbs[2],
-                "outer": asp.natal_orbs[3]
-            },
-            transit_orbs={
-                "luminary": asp.transit_orbs[0],
-                "personal": asp.transit_orbs[1],
-                "social": asp.transit_orbs[2],
-                "outer": asp.transit_orbs[3]
-            }
-        )
-        for asp in ChartConfig.ASPECTS if asp.major
-    ]
-
-    minor = [
-        AspectDefinitionResponse(
-            name=asp.name,
-            symbol=asp.symbol,
-            angle=asp.angle,
-            natal_orbs={
-                "luminary": asp.natal_orbs[0],
-                "personal": asp.natal_orbs[1],
-                "social": asp.natal_orbs[2],
-                "outer": asp.natal_orbs[3]
-            },
-            transit_orbs={
-                "luminary": asp.transit_orbs[0],
-                "personal": asp.transit_orbs[1],
-                "social": asp.transit_orbs[2],
-                "outer": asp.transit_orbs[3]
-            }
-        )
-        for asp in ChartConfig.ASPECTS if not asp.major
-    ]
-
-    return ConfigAspectsResponse(
-        major_aspects=major,
-        minor_aspects=minor
-    )
+    return _config_response(request, _ASPECTS_JSON, _ASPECTS_HEADERS)
 
 
 # Natal Chart Endpoints
@@ -172,14 +486,11 @@ async def get_aspects():
 )
 async def calculate_natal_chart(request: NatalChartRequest):
     """Calculate a single natal chart."""
-    try:
-        chart = _build_natal_chart(request)
-        result = chart.generate_full_chart()
-        return NatalChartResponse(**result)
-    except (InvalidCoordinatesError, InvalidTimezoneError):
-        raise
-    except Exception as e:
-        raise ChartCalculationError(f"Chart calculation failed: {str(e)}")
+    if _natal_queue is None:
+        return await run_in_threadpool(_calculate_natal, request)
+    future = asyncio.get_running_loop().create_future()
+    await _natal_queue.put((request, future))
+    return await future
 
 
 @router.post(
@@ -200,38 +511,25 @@ async def calculate_natal_chart(request: NatalChartRequest):
 )
 async def calculate_natal_batch(request: NatalChartBatchRequest):
     """Calculate multiple natal charts in batch."""
-    results = []
+    outcomes = [_quick_validate(chart_req) for chart_req in request.charts]
+
+    pending = [idx for idx, outcome in enumerate(outcomes) if outcome is None]
+    # A failed task (such as a dead pool worker) fails only its own item
+    computed = await asyncio.gather(*[
+        _run_in_pool(_worker_natal, request.charts[idx])
+        for idx in pending
+    ], return_exceptions=True)
+    for idx, outcome in zip(pending, computed):
+        if isinstance(outcome, Exception):
+            outcome = {"err": (type(outcome).__name__, str(outcome))}
+        outcomes[idx] = outcome
+
+    results = [
+        _batch_item(chart_req.id or f"chart_{idx}", outcome, NatalChartResponse)
+        for idx, (chart_req, outcome) in enumerate(zip(request.charts, outcomes))
+    ]
 
-    for idx, chart_req in enumerate(request.charts):
-        try:
-            chart = _build_natal_chart(chart_req)
-            data = chart.generate_full_chart()
-            results.append(BatchResultItem(
-                id=chart_req.id or f"chart_{idx}",
-                success=True,
-                data=NatalChartResponse(**data),
-                error=None
-            ))
-        except Exception as e:
-            results.append(BatchResultItem(
-                id=chart_req.id or f"chart_{idx}",
-                success=False,
-                data=None,
-                error=ErrorDetail(
-                    type=type(e).__name__,
-                    message=str(e),
-                    detail=None
-                )
-            ))
-
-    return BatchResponse(
-        results=results,
-        summary=BatchSummary(
-            total=len(results),
-            successful=sum(1 for r in results if r.success),
-            failed=sum(1 for r in results if not r.success)
-        )
-    )
+    return _batch_response(results)
 
 
 # Transit Endpoints
@@ -255,7 +553,7 @@ async def calculate_natal_batch(request: NatalChartBatchRequest):
         500: {"description": "Calculation error"}
     }
 )
-async def calculate_transits(request: TransitCalculationRequest):
+def calculate_transits(request: TransitCalculationRequest):
     """Calculate transits for a specific date."""
     try:
         natal = _build_natal_chart(request.natal_chart)
@@ -295,57 +593,43 @@ async def calculate_transits(request: TransitCalculationRequest):
 async def calculate_transits_batch(request: TransitBatchRequest):
     """Calculate multiple transit dates for one natal chart."""
     try:
-        natal = _build_natal_chart(request.natal_chart)
+        # Validate the natal chart off the event loop; a cache miss calculates it
+        await run_in_threadpool(_build_natal_chart, request.natal_chart)
     except Exception as e:
         raise HTTPException(
             status_code=422,
             detail=f"Invalid natal chart data: {str(e)}"
         )
 
-    results = []
-    transit_calc = TransitChart(natal)
+    # Split the dates into one contiguous run per worker, so each worker computes
+    # the natal chart once for its whole run
+    transit_dates = request.transit_dates
+    run_size = max(1, -(-len(transit_dates) // (os.cpu_count() or 1)))
+    starts = range(0, len(transit_dates), run_size)
+    runs = await asyncio.gather(*[
+        _run_in_pool(_worker_transits, request.natal_chart, transit_dates[start:start + run_size],
+                     request.include_minor_aspects, request.include_transit_to_transit,
+                     request.orb_factor)
+        for start in starts
+    ], return_exceptions=True)
+    # A failed run (such as a dead pool worker) fails only its own dates
+    outcomes = []
+    for start, run in zip(starts, runs):
+        if isinstance(run, Exception):
+            run = [{"err": (type(run).__name__, str(run))}] * len(transit_dates[start:start + run_size])
+        outcomes.extend(run)
+
+    results = [
+        _batch_item(transit_input.id or f"transit_{idx}", outcome, TransitResponse)
+        for idx, (transit_input, outcome) in enumerate(zip(transit_dates, outcomes))
+    ]
 
-    for idx, transit_input in enumerate(request.transit_dates):
-        try:
-            result = transit_calc.calculate_transits(
-                transit_date=transit_input.date,
-                timezone=transit_input.timezone,
-                include_minor_aspects=request.include_minor_aspects,
-                include_transit_to_transit=request.include_transit_to_transit,
-                orb_factor=request.orb_factor
-            )
-
-            results.append(BatchResultItem(
-                id=transit_input.id or f"transit_{idx}",
-                success=True,
-                data=TransitResponse(**result),
-                error=None
-            ))
-        except Exception as e:
-            results.append(BatchResultItem(
-                id=transit_input.id or f"transit_{idx}",
-                success=False,
-                data=None,
-                error=ErrorDetail(
-                    type=type(e).__name__,
-                    message=str(e),
-                    detail=None
-                )
-            ))
-
-    return BatchResponse(
-        results=results,
-        summary=BatchSummary(
-            total=len(results),
-            successful=sum(1 for r in results if r.success),
-            failed=sum(1 for r in results if not r.success)
-        )
-    )
+    return _batch_response(results)
 
 
 @router.post(
     "/transits/exact",
-    response_model=ExactTransitsResponse,
+    response_model=None,
     summary="Find Exact Transit Events",
     description="""
     Find exact transit events (when transiting planets form exact aspects to natal points)
@@ -364,18 +648,67 @@ async def calculate_transits_batch(request: TransitBatchRequest):
     The search algorithm handles retrograde motion and finds all exact crossings.
     """,
     responses={
-        200: {"description": "Successful search - returns list of exact transit events"},
+        200: {"description": "Successful search - returns list of exact transit events",
+              "model": ExactTransitsResponse},
         422: {"description": "Validation error - invalid date range or parameters"},
         500: {"description": "Calculation error"}
     }
 )
 async def find_exact_transits(request: ExactTransitsRequest):
     """Find exact transit events in a date range."""
+    try:
+        # Validate the natal chart off the event loop; a cache miss calculates it
+        await run_in_threadpool(_build_natal_chart, request.natal_chart)
+
+        # Each planet's search and de-duplication is independent: run one search per
+        # planet in the process pool, then merge. The stable sort keeps the order a
+        # single search would give to events at the same instant.
+        planets = list(ChartConfig.PLANETS_CORE) if request.planets is None else request.planets
+        per_planet = await asyncio.gather(*[
+            _run_in_pool(_worker_exact_transits, request.natal_chart, planet,
+                         request.start_date, request.end_date, request.timezone,
+                         request.aspects, request.natal_points)
+            for planet in dict.fromkeys(planets) if planet in ChartConfig.PLANETS_CORE
+        ])
+        events = sorted(itertools.chain.from_iterable(per_planet), key=_exact_date_key)
+
+        # TransitEvent dataclasses already match TransitEventData, so serialize them
+        # directly; OPT_UTC_Z writes UTC offsets as "Z" like Pydantic does
+        return Response(
+            content=orjson.dumps({"events": events, "count": len(events)}, option=orjson.OPT_UTC_Z),
+            media_type="application/json"
+        )
+    except (InvalidCoordinatesError, InvalidTimezoneError):
+        raise
+    except Exception as e:
+        raise ChartCalculationError(f"Exact transit search failed: {str(e)}")
+
+
+@router.post(
+    "/transits/exact/stream",
+    response_class=StreamingResponse,
+    summary="Stream Exact Transit Events",
+    description="""
+    Same search as `/transits/exact`, streamed as newline-delimited JSON: one
+    transit event object per line, in date order, with no wrapping object or count.
+
+    Clients can start processing events while the rest of the response is still
+    being sent, and the server never holds the whole serialized result.
+    """,
+    responses={
+        200: {"description": "Successful search - one exact transit event per line",
+              "content": {"application/x-ndjson": {}}},
+        422: {"description": "Validation error - invalid date range or parameters"},
+        500: {"description": "Calculation error"}
+    }
+)
+def stream_exact_transits(request: ExactTransitsRequest):
+    """Stream exact transit events in a date range as NDJSON."""
     try:
         natal = _build_natal_chart(request.natal_chart)
         transit_calc = TransitChart(natal)
 
-        events = transit_calc.find_exact_transits(
+        events = transit_calc.iter_exact_transits(
             start_date=request.start_date,
             end_date=request.end_date,
             timezone=request.timezone,
@@ -383,12 +716,18 @@ async def find_exact_transits(request: ExactTransitsRequest):
             aspects=request.aspects,
             natal_points=request.natal_points
         )
-
-        return ExactTransitsResponse(
-            events=_convert_transit_events(events),
-            count=len(events)
-        )
+        # The search runs up to the first event; pull it here so failures still
+        # become error responses instead of a truncated stream
+        first = next(events, None)
     except (InvalidCoordinatesError, InvalidTimezoneError):
         raise
     except Exception as e:
         raise ChartCalculationError(f"Exact transit search failed: {str(e)}")
+
+    if first is None:
+        return StreamingResponse(iter(()), media_type="application/x-ndjson")
+    return StreamingResponse(
+        (orjson.dumps(event, option=orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE)
+         for event in itertools.chain((first,), events)),
+        media_type="application/x-ndjson"
+    )